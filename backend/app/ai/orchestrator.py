@@ -169,7 +169,7 @@ class QueryOrchestrator:
                     state.messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": json.dumps(tool_result.model_dump())
+                        "content": tool_result.model_dump_json(),
                     })
 
             await self.db.commit()
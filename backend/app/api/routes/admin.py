@@ -1,5 +1,6 @@
 """Admin routes for database management."""
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from app.models.document_base import Document
 from app.models.document import DocumentSection
 from app.services.document_service import DocumentService
 from app.services.search_service import SearchService
+from app.services.seeding import clear_database
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -39,7 +41,7 @@ async def seed_database(
         if clear:
             # Clear vectors
             try:
-                search_service.clear_collection()
+                await search_service.clear_collection()
                 logger.info("Cleared vector store")
             except Exception as e:
                 logger.warning(f"Failed to clear vectors: {e}")
@@ -51,28 +53,17 @@ async def seed_database(
 
         stats = {"created": 0, "updated": 0, "unchanged": 0, "skipped": 0, "errors": 0}
 
-        async with AsyncSessionLocal() as db:
-            if clear:
-                # Clear database tables
-                from app.models.history import EditHistory
-                from app.models.suggestion import EditSuggestion
-                from app.models.query import Query
-                from app.models.section_dependency import SectionDependency
-
-                await db.execute(EditHistory.__table__.delete())
-                await db.execute(EditSuggestion.__table__.delete())
-                await db.execute(Query.__table__.delete())
-                await db.execute(SectionDependency.__table__.delete())
-                await db.execute(DocumentSection.__table__.delete())
-                await db.execute(Document.__table__.delete())
-                await db.commit()
-                logger.info("Cleared database tables")
+        if clear:
+            await clear_database()
+            logger.info("Cleared database tables")
 
+        async with AsyncSessionLocal() as db:
             service = DocumentService(db)
 
             for md_file in md_files:
                 try:
-                    content = md_file.read_text(encoding="utf-8").strip()
+                    # Keep disk reads off the event loop serving other requests
+                    content = (await asyncio.to_thread(md_file.read_text, encoding="utf-8")).strip()
                     if not content:
                         stats["skipped"] += 1
                         continue
@@ -124,10 +115,13 @@ async def get_stats(
         raise HTTPException(status_code=403, detail="Invalid secret")
 
     async with AsyncSessionLocal() as db:
-        docs = await db.scalar(select(func.count(Document.id)))
-        sections = await db.scalar(select(func.count(DocumentSection.id)))
+        # Both counts in one round trip, as scalar subqueries of a single row
+        docs, sections = (await db.execute(select(
+            select(func.count(Document.id)).scalar_subquery(),
+            select(func.count(DocumentSection.id)).scalar_subquery(),
+        ))).one()
 
-    vectors = SearchService().get_collection_stats().get("count", 0)
+    vectors = (await SearchService().get_collection_stats()).get("count", 0)
 
     return {
         "documents": docs,
@@ -1,8 +1,14 @@
 import logging
 from datetime import datetime, timedelta
 from uuid import UUID
-from app.api.utils.helper import get_history_or_404, list_history_entries
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Sequence
+from app.api.utils.helper import (
+    decode_history_cursor,
+    encode_history_cursor,
+    get_history_or_404,
+    list_history_entries,
+)
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy import select, func, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db
@@ -12,25 +18,56 @@ from app.schemas.history import HistoryResponse, HistoryStatsResponse
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _set_next_cursor(
+    response: Response,
+    entries: Sequence[EditHistory],
+    limit: int,
+) -> Sequence[EditHistory]:
+    if entries and len(entries) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_history_cursor(entries[-1])
+    return entries
+
 
 @router.get("/", response_model=list[HistoryResponse])
 async def list_history(
+    response: Response,
     skip: int = 0,
     limit: int = 20,
+    cursor: str | None = None,
     action: UserAction | None = None,
     db: AsyncSession = Depends(get_db)
 ) -> list[HistoryResponse]:
-    return await list_history_entries(db, skip=skip, limit=limit, action=action)
+    entries = await list_history_entries(
+        db,
+        skip=skip,
+        limit=limit,
+        cursor=decode_history_cursor(cursor) if cursor else None,
+        action=action,
+    )
+    return _set_next_cursor(response, entries, limit)
 
 
 @router.get("/document/{document_id}", response_model=list[HistoryResponse])
 async def get_document_history(
     document_id: UUID,
+    response: Response,
     skip: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db)
 ) -> list[HistoryResponse]:
-    return await list_history_entries(db, skip=skip, limit=limit, document_id=document_id)
+    entries = await list_history_entries(
+        db,
+        skip=skip,
+        limit=limit,
+        cursor=decode_history_cursor(cursor) if cursor else None,
+        document_id=document_id,
+    )
+    return _set_next_cursor(response, entries, limit)
 
 
 @router.get("/section/{section_id}", response_model=list[HistoryResponse])
@@ -51,24 +88,25 @@ async def get_history_entry(
 
 @router.get("/stats/summary", response_model=HistoryStatsResponse)
 async def get_history_stats(db: AsyncSession = Depends(get_db)) -> HistoryStatsResponse:
+    # One scan: per-action totals and last-7-days counts (COUNT ... FILTER)
+    week_ago = datetime.utcnow() - timedelta(days=7)
     result = await db.execute(
-        select(EditHistory.user_action, func.count(EditHistory.id))
+        select(
+            EditHistory.user_action,
+            func.count(EditHistory.id),
+            func.count(EditHistory.id).filter(EditHistory.created_at >= week_ago),
+        )
         .group_by(EditHistory.user_action)
     )
-    
+
     by_action: dict[str, int] = {}
+    recent_count = 0
     for row in result:
         action: UserAction = row[0]
         count: int = row[1]
         by_action[action.value] = count
+        recent_count += row[2]
 
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    recent_result = await db.execute(
-        select(func.count(EditHistory.id))
-        .where(EditHistory.created_at >= week_ago)
-    )
-    recent_count = recent_result.scalar() or 0
-    
     return HistoryStatsResponse(
         by_action=by_action,
         total=sum(by_action.values()),
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query as QueryParam
@@ -196,6 +198,10 @@ async def process_query_stream(
         default=False,
         description="Use Celery worker (subscribes to Redis events)",
     ),
+    client_id: str | None = QueryParam(
+        default=None,
+        description="Stable client ID; lets a reconnect resume Celery events where it left off",
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> EventSourceResponse:
     query = await get_query_or_404(db, query_id)
@@ -207,7 +213,7 @@ async def process_query_stream(
         )
 
     if use_celery:
-        return await _stream_from_celery(query_id, query.query_text)
+        return await _stream_from_celery(query_id, query.query_text, client_id)
     else:
         return await _stream_direct(query_id, query.query_text, db)
 
@@ -234,10 +240,7 @@ async def _stream_direct(
 
         try:
             async for event in publisher.events():
-                yield {
-                    "event": event.event.value,
-                    "data": json.dumps(event.data),
-                }
+                yield event.sse_bytes
         finally:
             if not task.done():
                 task.cancel()
@@ -252,6 +255,7 @@ async def _stream_direct(
 async def _stream_from_celery(
     query_id: UUID,
     query_text: str,
+    client_id: str | None = None,
 ) -> EventSourceResponse:
     task = process_query_async.delay(str(query_id), query_text)
     logger.info(f"Started Celery task {task.id} for query {query_id}")
@@ -261,34 +265,52 @@ async def _stream_from_celery(
             "event": "task_started",
             "data": json.dumps({"task_id": task.id, "query_id": str(query_id)}),
         }
+        async for message in _relay_redis_events(query_id, client_id):
+            yield message
 
-        subscriber: RedisEventSubscriber | None = None
-        try:
-            subscriber = RedisEventSubscriber(query_id)
-            async for event in subscriber.events():
-                if event.event == EventType.HEARTBEAT:
-                    yield {"event": "heartbeat", "data": "{}"}
-                    continue
+    return EventSourceResponse(event_generator())
 
-                yield {
-                    "event": event.event.value,
-                    "data": json.dumps(event.data, default=str),
-                }
+
+@router.get("/{query_id}/events")
+async def stream_query_events(
+    query_id: UUID,
+    client_id: str | None = QueryParam(
+        default=None,
+        description="Stable client ID; resumes after the last event delivered to it",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> EventSourceResponse:
+    """Re-attach to the event stream of a query already running in Celery."""
+    await get_query_or_404(db, query_id)
+    return EventSourceResponse(_relay_redis_events(query_id, client_id))
+
+
+async def _relay_redis_events(
+    query_id: UUID,
+    client_id: str | None,
+) -> AsyncIterator[bytes | dict[str, str]]:
+    """Relay a query's Redis event stream as pre-encoded SSE frames."""
+    subscriber: RedisEventSubscriber | None = None
+    try:
+        subscriber = RedisEventSubscriber(query_id, consumer_id=client_id)
+        # aclosing: breaking out still runs events()' cleanup (which flushes
+        # pending acks) now, not whenever the generator is garbage collected
+        async with aclosing(subscriber.events()) as events:
+            async for event in events:
+                yield event.sse_bytes
 
                 if event.event in (EventType.COMPLETED, EventType.ERROR):
                     break
 
-        except Exception as e:
-            logger.error(f"Error in event stream: {e}")
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": str(e)}),
-            }
-        finally:
-            if subscriber is not None:
-                await subscriber.close()
-
-    return EventSourceResponse(event_generator())
+    except Exception as e:
+        logger.error(f"Error in event stream: {e}")
+        yield {
+            "event": "error",
+            "data": json.dumps({"error": str(e)}),
+        }
+    finally:
+        if subscriber is not None:
+            await subscriber.close()
 
 
 @router.post("/{query_id}/process", response_model=QueryProcessResponse)
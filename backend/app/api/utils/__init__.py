@@ -1,5 +1,6 @@
 from .helper import get_query_or_404, get_suggestion_or_404, get_history_or_404, list_history_entries, get_recent_history_by_section
 from .helper import get_document_or_404, get_sections_or_404, get_pending_suggestions_by_section, decode_upload_file
+from .helper import encode_history_cursor, decode_history_cursor
 
 __all__ = [
     "get_recent_history_by_section",
@@ -10,5 +11,7 @@ __all__ = [
     "get_document_or_404",
     "get_sections_or_404", 
     "get_pending_suggestions_by_section",
-    "decode_upload_file"
+    "decode_upload_file",
+    "encode_history_cursor",
+    "decode_history_cursor",
 ]
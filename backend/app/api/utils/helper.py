@@ -1,7 +1,10 @@
+import base64
+import binascii
+import json
 from datetime import datetime, timedelta
 from uuid import UUID
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from typing import Any, Sequence
@@ -71,17 +74,42 @@ async def get_history_or_404(
     return entry
 
 
+HistoryCursor = tuple[datetime, UUID]
+
+
+def encode_history_cursor(entry: EditHistory) -> str:
+    """Opaque page cursor pointing just past `entry` in newest-first order."""
+    payload = json.dumps([entry.created_at.isoformat(), str(entry.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_history_cursor(cursor: str) -> HistoryCursor:
+    try:
+        created_at, entry_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(entry_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 async def list_history_entries(
     db: AsyncSession,
     *,
     skip: int = 0,
     limit: int = 20,
+    cursor: HistoryCursor | None = None,
     action: UserAction | None = None,
     document_id: UUID | None = None,
     section_id: UUID | None = None
 ) -> Sequence[EditHistory]:
 
-    stmt = select(EditHistory).order_by(EditHistory.created_at.desc())
+    # (created_at, id) gives a total order, so a cursor page is an index
+    # range scan instead of OFFSET's scan-and-discard of every earlier row
+    stmt = select(EditHistory).order_by(
+        EditHistory.created_at.desc(), EditHistory.id.desc()
+    )
     
     if action:
         stmt = stmt.where(EditHistory.user_action == action)
@@ -90,8 +118,12 @@ async def list_history_entries(
     if section_id:
         stmt = stmt.where(EditHistory.section_id == section_id)
     
-    stmt = stmt.offset(skip).limit(limit)
-    result = await db.execute(stmt)
+    if cursor:
+        stmt = stmt.where(tuple_(EditHistory.created_at, EditHistory.id) < cursor)
+    elif skip:
+        stmt = stmt.offset(skip)
+
+    result = await db.execute(stmt.limit(limit))
     return result.scalars().all()
 
 
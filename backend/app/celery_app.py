@@ -161,6 +161,13 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=3, minute=0),
     },
 
+    # Create upcoming edit_history partitions, drop expired ones
+    # Runs at 1 AM UTC daily, well ahead of each month boundary
+    "maintain-history-partitions-daily": {
+        "task": "app.tasks.sync_tasks.maintain_history_partitions",
+        "schedule": crontab(hour=1, minute=0),
+    },
+
     # Rebuild document dependency graph
     # Runs weekly on Sunday at 4 AM UTC
     "rebuild-dependencies-weekly": {
@@ -189,6 +196,15 @@ def init_worker(**kwargs):
     """
     logger.info("Celery worker process starting...")
 
+    # Tasks drive their async code through run_async(); give each worker
+    # process uvloop's faster event loop (uvicorn already picks it for the API)
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed, using the default asyncio loop")
+    else:
+        uvloop.install()
+
 
 @worker_process_shutdown.connect
 def shutdown_worker(**kwargs):
@@ -106,6 +106,7 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     redis_db: int = 0
     redis_password: str | None = None  # Set for production Redis
+    redis_max_connections: int = 64  # Per-process cap for each shared event-stream pool
 
     @property
     def redis_url(self) -> str:
@@ -140,6 +141,8 @@ class Settings(BaseSettings):
     openai_api_key: str = Field(..., description="OpenAI API key")
     openai_model: str = "gpt-4o"  # Main model for analysis/suggestions
     openai_embedding_model: str = "text-embedding-3-small"  # Fast, cheap embeddings
+    # Embedding requests in flight per batch call; raise on higher rate-limit tiers
+    openai_embedding_concurrency: int = 8
 
     # -------------------------------------------------------------------------
     # API Configuration
@@ -177,6 +180,12 @@ class Settings(BaseSettings):
         """Result backend URL - where task results are stored."""
         return self.celery_result_backend or self.redis_url
 
+    # -------------------------------------------------------------------------
+    # Edit History Retention
+    # -------------------------------------------------------------------------
+    # Whole monthly partitions older than this are dropped nightly (0 = keep all)
+    history_retention_months: int = 12
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
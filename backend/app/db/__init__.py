@@ -1,9 +1,12 @@
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, CompressedText, TimestampMixin, compress_text, decompress_text
 from app.db.session import async_session_maker, close_db, engine, get_db, init_db
 
 __all__ = [
     "Base",
     "TimestampMixin",
+    "CompressedText",
+    "compress_text",
+    "decompress_text",
     "engine",
     "async_session_maker",
     "get_db",
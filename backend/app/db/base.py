@@ -1,7 +1,16 @@
 from datetime import datetime
 from typing import Any
-from sqlalchemy import DateTime, func
+import zstandard
+from sqlalchemy import DateTime, LargeBinary, func
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+# zstd level for CompressedText: level 3 is zstd's default speed/ratio balance
+ZSTD_LEVEL = 3
+
+# First four bytes of every zstd frame
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 
 class Base(DeclarativeBase):
@@ -30,4 +39,32 @@ class TimestampMixin:
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
-    )
\ No newline at end of file
+    )
+
+
+def compress_text(value: str) -> bytes:
+    return zstandard.compress(value.encode("utf-8"), ZSTD_LEVEL)
+
+
+def decompress_text(value: bytes | str) -> str:
+    # Values written before the column was compressed come back as text (a
+    # column still TEXT) or as their raw UTF-8 bytes (after the column was
+    # converted to BYTEA). UTF-8 text never starts with the zstd magic
+    if isinstance(value, str):
+        return value
+    if not value.startswith(ZSTD_MAGIC):
+        return value.decode("utf-8")
+    return zstandard.decompress(value).decode("utf-8")
+
+
+class CompressedText(TypeDecorator[str]):
+    """Text stored as a zstd-compressed BYTEA; reads and writes plain str."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        return None if value is None else compress_text(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        return None if value is None else decompress_text(value)
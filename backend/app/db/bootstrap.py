@@ -1,7 +1,9 @@
 from app.db.base import Base
 from app.db.session import engine
+from app.models.history import convert_history_content_columns
 
 
 async def create_schema() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(convert_history_content_columns)
@@ -49,6 +49,17 @@ pool_config = (
     else {"pool_size": 2, "max_overflow": 5}
 )
 
+# =============================================================================
+# Statement Caching
+# =============================================================================
+# Audit/history endpoints run the same handful of queries on every page
+# render; caching both the SQL compilation and the server-side prepared
+# statements makes repeat executions cost only the query itself.
+# NOTE: PgBouncer in transaction mode needs statement_cache_size=0.
+
+STATEMENT_CACHE_SIZE = 1024
+QUERY_CACHE_SIZE = 1200
+
 # =============================================================================
 # SQLAlchemy Async Engine
 # =============================================================================
@@ -60,7 +71,16 @@ engine = create_async_engine(
     future=True,  # Use SQLAlchemy 2.0 style
     pool_pre_ping=True,  # Test connections before using (catches stale)
     pool_recycle=3600,  # Recycle connections after 1 hour
-    connect_args={"command_timeout": 60},  # 60s query timeout
+    connect_args={
+        "command_timeout": 60,  # 60s query timeout
+        # Per-connection prepared statement caches (asyncpg's own and
+        # SQLAlchemy's adapter); repeat queries skip PostgreSQL's parse/plan
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+    },
+    # Compiled SQL cache keyed on statement structure, so each combination
+    # of optional filters (e.g. list_history_entries) compiles only once
+    query_cache_size=QUERY_CACHE_SIZE,
     **pool_config,
 )
 
@@ -122,8 +142,9 @@ async def init_db() -> None:
     """
     Initialize database tables.
 
-    Creates all tables defined in SQLAlchemy models if they don't exist.
-    Called on application startup.
+    Creates all tables defined in SQLAlchemy models if they don't exist,
+    and converts edit history content columns created before compression
+    (see convert_history_content_columns). Called on application startup.
 
     Production Note:
     ----------------
@@ -138,8 +159,12 @@ async def init_db() -> None:
         alembic revision --autogenerate -m "Add users table"
         alembic upgrade head
     """
+    # Imported here: app.models imports app.db, which imports this module
+    from app.models.history import convert_history_content_columns
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(convert_history_content_columns)
 
 
 async def close_db() -> None:
@@ -38,7 +38,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import admin, documents, history, queries, suggestions
 from app.config import settings
 from app.db import close_db, init_db
-from app.services.search_service import search_service
+from app.services.search_service import close_openai_client, search_service
 
 
 # Configure logging - uses DEBUG in development for detailed traces
@@ -89,6 +89,7 @@ async def lifespan(app: FastAPI):
     # Graceful shutdown - close connections cleanly
     logger.info("Shutting down...")
     await search_service.close()
+    await close_openai_client()
     await close_db()
     logger.info("Shutdown complete")
 
@@ -191,7 +192,7 @@ async def health():
     - Add response time metrics
     - Implement readiness vs liveness probes separately
     """
-    search_stats = search_service.get_collection_stats()
+    search_stats = await search_service.get_collection_stats()
     return {
         "status": "healthy",
         "search_service": search_stats,
@@ -1,12 +1,14 @@
 import uuid
+from datetime import date, datetime, timezone
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, String, Text, Enum as SQLEnum
+from sqlalchemy import DateTime, ForeignKey, Index, String, Table, Text, event, func, text, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, CompressedText, TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.document import DocumentSection
@@ -24,23 +26,45 @@ class UserAction(str, Enum):
 class EditHistory(Base, TimestampMixin):
 
     __tablename__ = "edit_history"
+    # Append-only audit data, range-partitioned by month on created_at
+    # (see ensure_history_partitions). BRIN suits the time-ordered inserts.
+    # The composite indexes match the "filter by one key, newest first,
+    # LIMIT n" history queries, so they stop after n index entries instead
+    # of sorting; they also serve plain lookups on their leading column.
+    __table_args__ = (
+        Index("ix_edit_history_created_at_brin", "created_at", postgresql_using="brin"),
+        Index("ix_edit_history_doc_created", "document_id", text("created_at DESC")),
+        Index(
+            "ix_edit_history_section_created",
+            "section_id",
+            text("created_at DESC"),
+            postgresql_where=text("section_id IS NOT NULL"),
+        ),
+        Index("ix_edit_history_action_created", "user_action", text("created_at DESC")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
     )
+    # Part of the primary key: PostgreSQL requires the partition key in
+    # every unique constraint of a partitioned table
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+    )
     document_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     section_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("document_sections.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     suggestion_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -49,12 +73,13 @@ class EditHistory(Base, TimestampMixin):
         index=True,
     )
     
-    old_content: Mapped[str] = mapped_column(Text, nullable=False)
-    new_content: Mapped[str] = mapped_column(Text, nullable=False)
+    # zstd-compressed on write: edit snapshots are large, repetitive
+    # markdown and are only ever read back whole, never filtered on
+    old_content: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    new_content: Mapped[str] = mapped_column(CompressedText, nullable=False)
     user_action: Mapped[UserAction] = mapped_column(
         SQLEnum(UserAction),
         nullable=False,
-        index=True,
     )
     
 
@@ -66,4 +91,138 @@ class EditHistory(Base, TimestampMixin):
     document: Mapped["Document"] = relationship("Document", back_populates="history")
     suggestion: Mapped[Optional["EditSuggestion"]] = relationship(
         "EditSuggestion", back_populates="history_entries"
-    )
\ No newline at end of file
+    )
+
+
+# Months of partitions created ahead of the current one
+HISTORY_PARTITIONS_AHEAD = 2
+
+# Catches rows outside every monthly partition (e.g. old backfills), so
+# inserts never fail when maintenance falls behind
+HISTORY_DEFAULT_PARTITION = "edit_history_default"
+
+
+def history_partition_name(month: date) -> str:
+    """Name of the monthly partition holding `month`, e.g. edit_history_y2025m01."""
+    return f"edit_history_y{month.year}m{month.month:02d}"
+
+
+def next_month(month: date) -> date:
+    """First day of the month after `month`."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _partition_bounds(month: date) -> str:
+    """FOR VALUES clause of the monthly partition starting at `month`."""
+    return (
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+        f"TO ('{next_month(month).isoformat()} 00:00+00')"
+    )
+
+
+def history_partition_ddl(month: date) -> str:
+    """CREATE statement for the monthly partition holding `month` (idempotent)."""
+    start = month.replace(day=1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {history_partition_name(start)} "
+        f"PARTITION OF {EditHistory.__tablename__} {_partition_bounds(start)}"
+    )
+
+
+def is_history_partitioned(connection: Connection) -> bool:
+    """Whether edit_history is a partitioned table (tables created before partitioning are not)."""
+    return bool(connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": EditHistory.__tablename__},
+    ).scalar())
+
+
+def _create_history_partition(connection: Connection, month: date) -> None:
+    """
+    Create the partition for `month`, first moving any of its rows out of
+    the default partition (PostgreSQL refuses to create a partition whose
+    range overlaps rows already in DEFAULT).
+    """
+    name = history_partition_name(month)
+    end_month = next_month(month)
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = datetime(end_month.year, end_month.month, 1, tzinfo=timezone.utc)
+    has_default_rows = connection.execute(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM {HISTORY_DEFAULT_PARTITION} "
+            "WHERE created_at >= :start AND created_at < :end)"
+        ),
+        {"start": start, "end": end},
+    ).scalar()
+    if not has_default_rows:
+        connection.execute(text(history_partition_ddl(month)))
+        return
+
+    # Build the partition as a plain table holding those rows, then attach it
+    connection.execute(text(
+        f"CREATE TABLE {name} (LIKE {EditHistory.__tablename__} INCLUDING DEFAULTS)"
+    ))
+    connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {HISTORY_DEFAULT_PARTITION} "
+            "WHERE created_at >= :start AND created_at < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"start": start, "end": end},
+    )
+    connection.execute(text(
+        f"ALTER TABLE {EditHistory.__tablename__} ATTACH PARTITION {name} {_partition_bounds(month)}"
+    ))
+
+
+def ensure_history_partitions(connection: Connection, months_ahead: int = HISTORY_PARTITIONS_AHEAD) -> None:
+    """Create the default partition and monthly partitions up to `months_ahead`."""
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {HISTORY_DEFAULT_PARTITION} "
+        f"PARTITION OF {EditHistory.__tablename__} DEFAULT"
+    ))
+    existing = set(connection.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": EditHistory.__tablename__},
+    ).scalars())
+    month = date.today().replace(day=1)
+    for _ in range(months_ahead + 1):
+        if history_partition_name(month) not in existing:
+            _create_history_partition(connection, month)
+        month = next_month(month)
+
+
+def convert_history_content_columns(connection: Connection) -> None:
+    """
+    Convert old_content/new_content from TEXT to BYTEA on tables created
+    before they were compressed (create_all leaves existing tables alone).
+
+    Existing values become their UTF-8 bytes, which decompress_text reads
+    back as plain text; new writes are compressed. No-op once converted.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    columns = connection.execute(
+        text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table "
+            "AND column_name IN ('old_content', 'new_content') AND data_type = 'text'"
+        ),
+        {"table": EditHistory.__tablename__},
+    ).scalars().all()
+    for column in columns:
+        connection.execute(text(
+            f"ALTER TABLE {EditHistory.__tablename__} ALTER COLUMN {column} "
+            f"TYPE bytea USING convert_to({column}, 'UTF8')"
+        ))
+
+
+@event.listens_for(EditHistory.__table__, "after_create")
+def _create_history_partitions(target: Table, connection: Connection, **kw: Any) -> None:
+    """A partitioned table accepts no rows until partitions exist."""
+    if connection.dialect.name == "postgresql":
+        ensure_history_partitions(connection)
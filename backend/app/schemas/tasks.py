@@ -116,4 +116,8 @@ class ServiceHealthDict(TypedDict):
 
 class HealthCheckResultDict(TypedDict):
     healthy: bool
-    services: ServiceHealthDict
\ No newline at end of file
+    services: ServiceHealthDict
+
+
+class HistoryPartitionsResultDict(TypedDict):
+    dropped_partitions: list[str]
@@ -88,9 +88,13 @@ class DocumentService:
 
     HEADER_PATTERN: re.Pattern[str] = re.compile(r"^(#{1,6})\s+(.+)$")
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        search_service: SearchService | None = None,
+    ) -> None:
         self.db = db
-        self._search_service: SearchService | None = None
+        self._search_service = search_service
         self._dependency_service: DependencyService | None = None
 
     @property
@@ -106,8 +110,11 @@ class DocumentService:
         return self._dependency_service
 
     @staticmethod
-    def calculate_checksum(content: str) -> str:
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    def calculate_checksum(content: str | bytes) -> str:
+        # Bytes are hashed as-is: equal to the checksum of the text they encode
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.sha256(content).hexdigest()
 
     @classmethod
     def parse_sections(cls, content: str) -> list[ParsedSection]:
@@ -244,35 +251,14 @@ class DocumentService:
         self.db.add(doc)
         await self.db.flush()
 
-        for i, parsed in enumerate(parsed_sections):
-            section = DocumentSection(
-                document_id=doc.id,
-                section_title=parsed.title or f"Section {i + 1}",
-                content=parsed.content,
-                order=i,
-                start_line=parsed.start_line,
-                end_line=parsed.end_line,
-            )
-            self.db.add(section)
-            await self.db.flush()
-
-            if generate_embeddings and parsed.content.strip():
-                try:
-                    embedding_id = await self.search_service.add_section(
-                        section_id=str(section.id),
-                        content=parsed.content,
-                        metadata={
-                            "document_id": str(doc.id),
-                            "file_path": file_path,
-                            "section_title": section.section_title,
-                            "order": i,
-                        },
-                    )
-                    section.embedding_id = embedding_id
-                except Exception as e:
-                    logger.warning(f"Failed to generate embedding for section: {e}")
+        sections = await self._add_sections(doc.id, parsed_sections)
+        to_embed = [sec for sec in sections if sec.content.strip()] if generate_embeddings else []
 
-        await self.db.commit()
+        if to_embed:
+            try:
+                await self._embed_sections(to_embed, doc.id, file_path)
+            except Exception as e:
+                logger.warning(f"Failed to generate embeddings for '{file_path}': {e}")
 
         await self._build_section_dependencies(doc)
 
@@ -281,11 +267,60 @@ class DocumentService:
         )
         return doc
 
+    async def _add_sections(
+        self,
+        document_id: UUID,
+        parsed_sections: list[ParsedSection],
+    ) -> list[DocumentSection]:
+        """Insert a document's parsed sections with one flush (a single batched INSERT)."""
+        sections = [
+            DocumentSection(
+                document_id=document_id,
+                section_title=parsed.title or f"Section {i + 1}",
+                content=parsed.content,
+                order=i,
+                start_line=parsed.start_line,
+                end_line=parsed.end_line,
+            )
+            for i, parsed in enumerate(parsed_sections)
+        ]
+        self.db.add_all(sections)
+        await self.db.flush()
+        return sections
+
+    async def _embed_sections(
+        self,
+        sections: list[DocumentSection],
+        document_id: UUID,
+        file_path: str,
+    ) -> None:
+        """Embed a document's sections in batched upserts and record their embedding IDs."""
+        embedding_ids = await self.search_service.add_sections_batch([
+            (
+                str(section.id),
+                section.content,
+                {
+                    "document_id": str(document_id),
+                    "file_path": file_path,
+                    "section_title": section.section_title,
+                    "order": section.order,
+                },
+            )
+            for section in sections
+        ])
+        for section, embedding_id in zip(sections, embedding_ids):
+            section.embedding_id = embedding_id
+
     async def _build_section_dependencies(self, doc: Document) -> None:
+        """Store the document's section dependencies and commit the document."""
         await self.db.refresh(doc, ["sections"])
         for section in doc.sections:
             try:
-                await self.dependency_service.parse_and_store_dependencies(section)
+                # A savepoint per section: a failure discards only that
+                # section's dependencies, so the document (sections included)
+                # still goes out in the single commit below
+                async with self.db.begin_nested():
+                    await self.dependency_service.parse_and_store_dependencies(section)
             except Exception as e:
                 logger.warning(
                     f"Failed to build dependencies for section {section.id}: {e}"
@@ -319,34 +354,15 @@ class DocumentService:
         parsed_sections = self.parse_sections(content)
         doc.title = self._extract_title(parsed_sections, file_path)
 
-        for i, parsed in enumerate(parsed_sections):
-            section = DocumentSection(
-                document_id=doc.id,
-                section_title=parsed.title or f"Section {i + 1}",
-                content=parsed.content,
-                order=i,
-                start_line=parsed.start_line,
-                end_line=parsed.end_line,
-            )
-            self.db.add(section)
-            await self.db.flush()
-
-            if generate_embeddings and parsed.content.strip():
-                try:
-                    section.embedding_id = await self.search_service.add_section(
-                        section_id=str(section.id),
-                        content=parsed.content,
-                        metadata={
-                            "document_id": str(doc.id),
-                            "file_path": file_path,
-                            "section_title": section.section_title,
-                            "order": i,
-                        },
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to update embedding: {e}")
+        sections = await self._add_sections(doc.id, parsed_sections)
+        to_embed = [sec for sec in sections if sec.content.strip()] if generate_embeddings else []
+
+        if to_embed:
+            try:
+                await self._embed_sections(to_embed, doc.id, file_path)
+            except Exception as e:
+                logger.warning(f"Failed to update embeddings for '{file_path}': {e}")
 
-        await self.db.commit()
         await self._build_section_dependencies(doc)
 
         logger.info(
@@ -53,15 +53,19 @@ Production Considerations:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import queue
+import sys
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
-from typing import Any, AsyncGenerator, Protocol
+from functools import lru_cache
+from typing import Any, AsyncGenerator, NamedTuple, Protocol
 from uuid import UUID
 
+import orjson
 import redis.asyncio as aioredis
 from redis.asyncio.client import Redis
 import redis as sync_redis
@@ -71,11 +75,78 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Maximum events to retain in a stream (oldest are evicted when exceeded)
+# Maximum events to retain in a stream (oldest are evicted when exceeded).
+# Trimming is approximate (MAXLEN ~) so Redis only trims whole listpack
+# nodes instead of doing exact trim work on every XADD.
 STREAM_MAX_LEN = 1000
 
 # How long to keep completed streams before auto-deletion (1 hour)
-STREAM_TTL_SECONDS = 3600 
+STREAM_TTL_SECONDS = 3600
+
+# Celery-side publishing goes through a per-process queue drained by a
+# background writer thread (see RedisEventPublisher). The queue is bounded
+# so a stalled Redis can't grow worker memory; each drain writes up to
+# PUBLISH_BATCH_SIZE entries in one pipelined round-trip.
+PUBLISH_QUEUE_MAXSIZE = 1024
+PUBLISH_BATCH_SIZE = 64
+
+# How long close_sync() waits for the writer to deliver a stream's tail
+PUBLISH_CLOSE_TIMEOUT_SECONDS = 10.0
+
+# Redis Stream entry fields for one event (see _event_fields)
+StreamFields = dict[bytes, bytes]
+
+# Field of the placeholder entry written by RedisEventPublisher.open_sync()
+STREAM_OPEN_FIELD = b"_open"
+
+# Max entries fetched per XREAD call (larger batches amortize round-trips)
+XREAD_COUNT = 256
+
+# Shared sync connection pool for Celery-side publishers. Creating the pool
+# doesn't connect; connections are opened on demand and reused across
+# queries, so each query no longer pays its own TCP + AUTH handshake.
+# Responses stay as bytes so stored event data can be relayed without decoding.
+_SYNC_POOL = sync_redis.ConnectionPool.from_url(
+    settings.redis_url,
+    decode_responses=False,
+    max_connections=settings.redis_max_connections,
+)
+
+# Shared async connection pool for SSE subscribers (one per FastAPI process)
+_ASYNC_POOL = aioredis.ConnectionPool.from_url(
+    settings.redis_url,
+    decode_responses=False,
+    max_connections=settings.redis_max_connections,
+)
+
+
+# Last formatted timestamp, reused for events created in the same millisecond,
+# plus the "YYYY-MM-DDTHH:MM:SS" prefix of the current second
+_last_ts_ms = 0
+_last_ts_str = ""
+_last_ts_sec = -1
+_last_ts_sec_prefix = ""
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO string, cached per millisecond.
+
+    Bursts of events (tool calls, statuses) are often created within the
+    same millisecond; reusing the formatted string avoids formatting a
+    timestamp for each one. No datetime is built: the seconds prefix is
+    formatted once per second and only the millisecond suffix changes.
+    """
+    global _last_ts_ms, _last_ts_str, _last_ts_sec, _last_ts_sec_prefix
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _last_ts_ms:
+        sec, ms = divmod(now_ms, 1000)
+        if sec != _last_ts_sec:
+            _last_ts_sec = sec
+            _last_ts_sec_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _last_ts_ms = now_ms
+        _last_ts_str = f"{_last_ts_sec_prefix}.{ms:03d}000"
+    return _last_ts_str
 
 
 class EventType(str, Enum):
@@ -94,24 +165,56 @@ class EventType(str, Enum):
     HEARTBEAT = "heartbeat"     # Keep-alive (prevents browser timeout)
 
 
-@dataclass
+# Value -> member lookup used when decoding events (cheaper than EventType(value))
+_EVENT_BY_VALUE: dict[str, EventType] = {e.value: e for e in EventType}
+
+# Per-type constants precomputed once, so encoding an event doesn't
+# re-read and re-encode the enum value (and decoding skips .decode())
+_EVENT_TYPE_BYTES: dict[EventType, bytes] = {e: e.value.encode() for e in EventType}
+_EVENT_BY_BYTES: dict[bytes, EventType] = {e.value.encode(): e for e in EventType}
+_SSE_PREFIX: dict[EventType, bytes] = {
+    e: b"event: " + e.value.encode() + b"\r\ndata: " for e in EventType
+}
+
+# Direct-mode queue capacity; a full queue suspends the producer (backpressure)
+DIRECT_QUEUE_MAXSIZE = 256
+
+# Direct-mode queue depth above which progress-only events are dropped
+DIRECT_SHED_WATERMARK = DIRECT_QUEUE_MAXSIZE // 2
+
+# Events the UI can miss without losing results (SUGGESTION/COMPLETED/ERROR are never shed)
+_SHEDDABLE_EVENTS = frozenset({EventType.STATUS, EventType.HEARTBEAT, EventType.TOOL_CALL})
+
+# Chatty events the Redis publisher drops first when its queue is full;
+# any other event waits for space instead
+_LOW_PRIORITY_EVENTS = frozenset({EventType.TOOL_CALL, EventType.HEARTBEAT})
+
+
+@dataclass(slots=True)
 class QueryEvent:
     """
     A single event in the query processing stream.
 
     Represents one update that should be sent to the frontend via SSE.
-    Serializes to JSON for transmission and storage in Redis.
+    Serializes to JSON for SSE and to native stream fields for Redis.
 
     Fields:
         event: The event type (STATUS, SUGGESTION, etc.)
         data: Event-specific payload (varies by event type)
         query_id: Links event to originating query
         timestamp: ISO format timestamp for ordering/debugging
+
+    Uses __slots__ (no per-instance __dict__), since many events can be
+    buffered at once in the Direct queue or in-flight in the subscriber.
     """
     event: EventType
     data: dict[str, Any]
     query_id: str
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_utc_now_iso)
+    # Memoized encodings, filled on first use (events are never mutated after creation)
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
+    _fields: StreamFields | None = field(default=None, init=False, repr=False, compare=False)
+    _sse: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -123,24 +226,125 @@ class QueryEvent:
         }
 
     def to_json(self) -> str:
-        """Serialize to JSON string for Redis/SSE transmission."""
-        return json.dumps(self.to_dict(), default=str)
+        """Serialize to JSON string (cached after the first call)."""
+        if self._json is None:
+            self._json = orjson.dumps(self.to_dict(), default=str).decode()
+        return self._json
+
+    @property
+    def sse_bytes(self) -> bytes:
+        """
+        Pre-encoded SSE frame for this event (preferred SSE output).
+
+        Built once per event and cached, so the SSE endpoint (and any
+        future fan-out to multiple clients) writes the same buffer
+        instead of re-serializing and re-encoding on every send.
+        """
+        if self._sse is None:
+            self._sse = (
+                _SSE_PREFIX[self.event] + orjson.dumps(self.data, default=str) + b"\r\n\r\n"
+            )
+        return self._sse
+
+    def to_stream_fields(self) -> StreamFields:
+        """Encode as Redis Stream entry fields (cached after the first call)."""
+        if self._fields is None:
+            self._fields = _event_fields(
+                self.event, self.data, self.query_id.encode(), self.timestamp
+            )
+        return self._fields
 
     @classmethod
-    def from_json(cls, data: str) -> QueryEvent:
-        """Deserialize from JSON string (used by subscriber)."""
-        parsed = json.loads(data)
+    def from_json(cls, data: str | bytes) -> QueryEvent:
+        """Deserialize from JSON string or bytes."""
+        parsed = orjson.loads(data)
         return cls(
-            event=EventType(parsed["event"]),
+            event=_EVENT_BY_VALUE[parsed["event"]],
             data=parsed["data"],
             query_id=parsed["query_id"],
-            timestamp=parsed.get("timestamp", datetime.utcnow().isoformat()),
+            timestamp=parsed.get("timestamp") or _utc_now_iso(),
         )
 
 
-def _get_stream_name(query_id: str | UUID) -> str:
-    """Generate Redis stream key for a query. Format: 'query_stream:{uuid}'"""
-    return f"query_stream:{query_id}"
+def _event_fields(
+    event: EventType, data: dict[str, Any], query_id: bytes, timestamp: str
+) -> StreamFields:
+    """
+    Encode an event as native Redis Stream fields.
+
+    Type, query ID and timestamp are stored as plain fields (repeated
+    field names are deduplicated by the stream's listpack encoding); only
+    the data payload is encoded, as the exact JSON the SSE frame carries,
+    so subscribers can forward it without decoding (see StreamEvent).
+    """
+    return {
+        b"t": _EVENT_TYPE_BYTES[event],
+        b"q": query_id,
+        b"ts": timestamp.encode(),
+        b"d": orjson.dumps(data, default=str),
+    }
+
+
+# Encoded data of the end-of-stream sentinel, matched byte-for-byte by subscribers
+_STREAM_END_PAYLOAD = orjson.dumps({"_stream_end": True})
+
+
+class StreamEvent(NamedTuple):
+    """
+    An event read from a Redis Stream, with its data still JSON-encoded.
+
+    The subscriber only relays events to SSE clients, so it never needs
+    the decoded data: the stored JSON goes straight into the SSE frame.
+    Call to_event() when a decoded QueryEvent is actually needed.
+    """
+    event: EventType
+    query_id: str
+    timestamp: str
+    payload: bytes  # JSON-encoded event data
+
+    @property
+    def sse_bytes(self) -> bytes:
+        """SSE frame built around the stored payload (no re-serialization)."""
+        return _SSE_PREFIX[self.event] + self.payload + b"\r\n\r\n"
+
+    def to_event(self) -> QueryEvent:
+        """Decode into a full QueryEvent."""
+        return QueryEvent(
+            event=self.event,
+            data=orjson.loads(self.payload),
+            query_id=self.query_id,
+            timestamp=self.timestamp,
+        )
+
+    @classmethod
+    def from_stream_fields(cls, fields: dict[bytes, bytes]) -> StreamEvent:
+        """Wrap Redis Stream entry fields without decoding the data."""
+        ts = fields.get(b"ts")
+        return cls(
+            event=_EVENT_BY_BYTES[fields[b"t"]],
+            query_id=fields[b"q"].decode(),
+            timestamp=ts.decode() if ts else _utc_now_iso(),
+            payload=fields[b"d"],
+        )
+
+
+_STREAM_PREFIX = "query_stream:"
+
+
+@lru_cache(maxsize=1024)
+def _get_stream_name(query_id: str) -> str:
+    """
+    Generate Redis stream key for a query. Format: 'query_stream:{uuid}'
+
+    Cached so repeated publishers/subscribers for the same query
+    (e.g. SSE reconnects) reuse one string instead of re-formatting it.
+    Callers pass the str form, so a UUID and its string share one entry.
+    """
+    return f"{_STREAM_PREFIX}{query_id}"
+
+
+# Data of the ERROR event a subscriber emits when its overall timeout expires
+_TIMEOUT_PAYLOAD = orjson.dumps({"error": "Event stream timeout"})
 
 
 class EventPublisher(Protocol):
@@ -160,9 +364,22 @@ class EventPublisher(Protocol):
         ...
 
 
+class RawEventPublisher(EventPublisher, Protocol):
+    """
+    Optional extension for publishers that accept pre-encoded payloads.
+
+    EventEmitter uses publish_raw when available, encoding the event
+    straight to stream fields without building a QueryEvent.
+    """
+
+    async def publish_raw(self, event: EventType, payload: StreamFields) -> None:
+        """Publish an already-encoded event (see _event_fields)."""
+        ...
+
+
 class DirectEventPublisher:
     """
-    In-process event publisher using asyncio Queue.
+    In-process event publisher backed by a deque.
 
     Used when query processing happens in the same process as the
     HTTP server (no Celery). Events flow directly from AI agent
@@ -181,30 +398,52 @@ class DirectEventPublisher:
         publisher = DirectEventPublisher(query_id)
         await publisher.publish(QueryEvent(...))
         async for event in publisher.events():
-            yield format_sse(event)
+            yield event.sse_bytes
         await publisher.close()
     """
 
     def __init__(self, query_id: str | UUID) -> None:
         self.query_id = str(query_id)
-        self._events: asyncio.Queue[QueryEvent] = asyncio.Queue()
+        # Single producer / single consumer on one loop, so a deque plus two
+        # Events is enough (no Queue getter/putter bookkeeping). Bounded at
+        # DIRECT_QUEUE_MAXSIZE so a slow SSE consumer can't make a fast
+        # producer grow memory without limit.
+        self._events: deque[QueryEvent] = deque()
+        self._ready = asyncio.Event()  # Set when events are waiting
+        self._space = asyncio.Event()  # Set when the consumer frees a slot
         self._closed = False
 
     async def publish(self, event: QueryEvent) -> None:
-        """Add event to queue for consumption by SSE endpoint."""
-        if not self._closed:
-            await self._events.put(event)
+        """
+        Add event to queue for consumption by SSE endpoint.
+
+        When the consumer falls behind (queue at DIRECT_SHED_WATERMARK),
+        cheap progress events are dropped. Other events wait for space,
+        so publish() may suspend the producer; that backpressure is what
+        keeps memory bounded.
+        """
+        if self._closed:
+            return
+        if event.event in _SHEDDABLE_EVENTS and len(self._events) >= DIRECT_SHED_WATERMARK:
+            return
+        while len(self._events) >= DIRECT_QUEUE_MAXSIZE:
+            self._space.clear()
+            await self._space.wait()
+        self._events.append(event)
+        self._ready.set()
 
     async def close(self) -> None:
         """Signal end of stream with sentinel event."""
         self._closed = True
-        await self._events.put(
+        # Never waits for space: the sentinel may sit one past the bound
+        self._events.append(
             QueryEvent(
                 event=EventType.COMPLETED,
                 data={"_stream_end": True},
                 query_id=self.query_id,
             )
         )
+        self._ready.set()
 
     async def events(self) -> AsyncGenerator[QueryEvent, None]:
         """
@@ -213,11 +452,80 @@ class DirectEventPublisher:
         Blocks until events are available, yields them one by one,
         and terminates when stream end sentinel is received.
         """
+        events = self._events
         while True:
-            event = await self._events.get()
-            if event.data.get("_stream_end"):
+            while events:
+                event = events.popleft()
+                self._space.set()
+                if event.data.get("_stream_end"):
+                    return
+                yield event
+            self._ready.clear()
+            await self._ready.wait()
+
+
+# Queued write: (stream, entry fields or None, Event set once written or None)
+_PublishItem = tuple[str, StreamFields | None, threading.Event | None]
+
+_publish_queue: queue.Queue[_PublishItem] = queue.Queue(maxsize=PUBLISH_QUEUE_MAXSIZE)
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def _ensure_writer() -> None:
+    """Start the background writer thread on first use in this process."""
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        # Re-checked under the lock; also restarts after a fork, which
+        # doesn't carry threads into the child process
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="redis-event-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def _writer_loop() -> None:
+    """
+    Drain the publish queue, writing each batch in one pipeline round-trip.
+
+    Items with a done Event are stream ends: their stream TTL is refreshed
+    in the same pipeline and the Event is set once the batch is written
+    (or has failed), releasing the waiting close_sync().
+    """
+    client: SyncRedis[bytes] = sync_redis.Redis(connection_pool=_SYNC_POOL)
+    while True:
+        batch = [_publish_queue.get()]
+        while len(batch) < PUBLISH_BATCH_SIZE:
+            try:
+                batch.append(_publish_queue.get_nowait())
+            except queue.Empty:
                 break
-            yield event
+        try:
+            pipe = client.pipeline(transaction=False)
+            for stream_name, fields, done in batch:
+                if fields is not None:
+                    # Streams are pre-created by open_sync(), so NOMKSTREAM
+                    # keeps the per-event XADD off Redis' key-creation path
+                    pipe.xadd(
+                        stream_name,
+                        fields,
+                        maxlen=STREAM_MAX_LEN,
+                        approximate=True,
+                        nomkstream=True,
+                    )
+                if done is not None:
+                    pipe.expire(stream_name, STREAM_TTL_SECONDS)
+            pipe.execute()
+            logger.debug("Published %d events", len(batch))
+        except Exception as e:
+            logger.error(f"Failed to publish {len(batch)} events: {e}", exc_info=True)
+        finally:
+            for _, _, done in batch:
+                if done is not None:
+                    done.set()
 
 
 class RedisEventPublisher:
@@ -234,112 +542,162 @@ class RedisEventPublisher:
     with Celery's concurrency model causes issues. We use sync Redis
     client (redis-py) here, which works reliably in Celery tasks.
 
+    Background Writer:
+    ------------------
+    Publishing never waits on Redis: events are put on a bounded
+    per-process queue and a daemon thread writes them in pipelined
+    batches (see PUBLISH_QUEUE_MAXSIZE, PUBLISH_BATCH_SIZE). Order is
+    preserved per stream. When the queue is full, TOOL_CALL/HEARTBEAT
+    events are dropped and any other event waits for space.
+
     Stream Lifecycle:
     -----------------
-    1. Created when first event is published (XADD auto-creates)
-    2. Events accumulate up to STREAM_MAX_LEN (oldest evicted)
+    1. Created with a TTL by open_sync() at query start
+    2. Events accumulate up to STREAM_MAX_LEN (oldest evicted); event
+       XADDs use NOMKSTREAM, so nothing is written to a stream that
+       wasn't opened (or has already expired)
     3. Stream end marker published on close()
-    4. TTL set on close() for automatic cleanup
+    4. TTL refreshed on close() so finished streams live a full TTL
+
+    Setting the TTL up front means a stream is still cleaned up if the
+    worker dies mid-query and close() never runs.
 
     Usage (in Celery task):
         publisher = RedisEventPublisher(query_id)
+        publisher.open_sync()
         publisher.publish_sync(QueryEvent(...))  # Use sync version in Celery
         publisher.close_sync()
     """
 
     def __init__(self, query_id: str | UUID) -> None:
-        self.query_id = str(query_id)
-        self.stream_name = _get_stream_name(query_id)
-        self._sync_redis: SyncRedis[str] | None = None
-        logger.info(f"RedisEventPublisher created for stream: {self.stream_name}")
-
-    def _ensure_sync_connected(self) -> SyncRedis[str]:
-        """Lazily connect to Redis on first use."""
-        if self._sync_redis is None:
-            logger.info(f"Connecting to Redis: {settings.redis_url}")
-            self._sync_redis = sync_redis.from_url(
-                settings.redis_url,
-                decode_responses=True,
-            )
-            self._sync_redis.ping()  # Verify connection works
-            logger.info("Redis connection established")
-        return self._sync_redis
+        self.stream_name = _get_stream_name(str(query_id))
+        # Constructing a pooled client doesn't connect: connections are
+        # opened lazily by the pool, and a dead Redis surfaces on the first
+        # write (no up-front PING round-trip on the first-event path)
+        self._redis: SyncRedis[bytes] = sync_redis.Redis(connection_pool=_SYNC_POOL)
+        logger.debug("RedisEventPublisher created for stream: %s", self.stream_name)
+
+    @property
+    def query_id(self) -> str:
+        """Query ID derived from the stream name (only needed off the hot path)."""
+        return self.stream_name[len(_STREAM_PREFIX):]
 
     def publish_sync(self, event: QueryEvent) -> None:
         """
         Publish event to Redis Stream (synchronous version for Celery).
 
-        Uses XADD command which:
-        - Auto-creates stream if it doesn't exist
-        - Appends event with auto-generated message ID
-        - Trims stream to MAXLEN, evicting oldest events
+        The event is queued for the background writer, which XADDs it
+        (trimming to ~MAXLEN) in a pipelined batch. The XADD uses
+        NOMKSTREAM, so open_sync() must have run first: events for a
+        stream that doesn't exist yet are dropped silently. Write
+        failures are logged by the writer, not raised here.
 
         Args:
             event: The QueryEvent to publish
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Publishing to %s: %s", self.stream_name, event.event.value)
+        self.publish_raw_sync(event.event, event.to_stream_fields())
+
+    def publish_raw_sync(self, event: EventType, payload: StreamFields) -> None:
+        """
+        Publish an already-encoded event to the Redis Stream.
+
+        Args:
+            event: Type of the encoded event (decides whether it may be dropped)
+            payload: Stream fields from _event_fields / QueryEvent.to_stream_fields
+        """
+        if not self._enqueue(event, payload):
+            _publish_queue.put((self.stream_name, payload, None))
+
+    def _enqueue(self, event: EventType, payload: StreamFields) -> bool:
+        """
+        Queue a payload without blocking.
+
+        Returns False if the queue is full and the event must wait for
+        space; low-priority events are dropped instead (returns True).
+        """
+        _ensure_writer()
+        try:
+            _publish_queue.put_nowait((self.stream_name, payload, None))
+        except queue.Full:
+            if event in _LOW_PRIORITY_EVENTS:
+                logger.debug("Publish queue full, dropped %s for %s", event.value, self.stream_name)
+                return True
+            return False
+        return True
+
+    async def publish(self, event: QueryEvent) -> None:
+        """Async publish (implements EventPublisher protocol)."""
+        await self.publish_raw(event.event, event.to_stream_fields())
+
+    async def publish_raw(self, event: EventType, payload: StreamFields) -> None:
+        """
+        Async publish of an encoded payload (implements RawEventPublisher protocol).
+
+        Only waits (in a worker thread) when the queue is full.
+        """
+        if not self._enqueue(event, payload):
+            await asyncio.to_thread(_publish_queue.put, (self.stream_name, payload, None))
+
+    def open_sync(self) -> None:
+        """
+        Create the stream and set its TTL before any events are published.
+
+        Must be called before publishing: event writes never create the
+        stream themselves (XADD NOMKSTREAM).
 
-        Raises:
-            Exception: If Redis connection fails
+        Writes a placeholder entry (no event fields, skipped by the
+        subscriber) and EXPIRE in one pipeline round-trip.
         """
         try:
-            redis = self._ensure_sync_connected()
-            event_json = event.to_json()
-            logger.info(f"Publishing to {self.stream_name}: {event.event.value}")
-            message_id = redis.xadd(
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.xadd(
                 self.stream_name,
-                {"event": event_json},
+                {STREAM_OPEN_FIELD: b"1"},
                 maxlen=STREAM_MAX_LEN,
+                approximate=True,
             )
-            logger.info(f"Published {event.event.value} to {self.stream_name}, message_id: {message_id}")
+            pipe.expire(self.stream_name, STREAM_TTL_SECONDS)
+            pipe.execute()
+            logger.info("Opened stream %s", self.stream_name)
         except Exception as e:
-            logger.error(f"Failed to publish event: {e}", exc_info=True)
-            raise
-
-    async def publish(self, event: QueryEvent) -> None:
-        """Async wrapper for publish_sync (implements EventPublisher protocol)."""
-        self.publish_sync(event)
+            logger.error(f"Error opening stream {self.stream_name}: {e}", exc_info=True)
 
     def close_sync(self) -> None:
         """
-        Close the stream and cleanup resources.
+        Close the stream and wait for queued events to be written.
 
-        Operations:
-        1. Publish stream end sentinel event
-        2. Set TTL on stream for automatic cleanup
-        3. Close Redis connection
-
-        The TTL ensures streams are eventually deleted even if
-        no subscriber ever connects to consume them.
+        The stream end sentinel is queued behind this stream's events and
+        written together with a TTL refresh, so finished streams are
+        deleted even if no subscriber ever connects. Blocks until the
+        writer has handled it (at most PUBLISH_CLOSE_TIMEOUT_SECONDS), so
+        the task doesn't finish before its events reach Redis.
         """
         try:
-            redis = self._ensure_sync_connected()
-
-            # Publish sentinel event to signal stream end
             end_event = QueryEvent(
                 event=EventType.COMPLETED,
                 data={"_stream_end": True},
                 query_id=self.query_id,
             )
-            logger.info(f"Publishing stream end to {self.stream_name}")
-            redis.xadd(
-                self.stream_name,
-                {"event": end_event.to_json()},
-                maxlen=STREAM_MAX_LEN,
+            logger.debug("Publishing stream end to %s", self.stream_name)
+            _ensure_writer()
+            done = threading.Event()
+            _publish_queue.put(
+                (self.stream_name, end_event.to_stream_fields(), done),
+                timeout=PUBLISH_CLOSE_TIMEOUT_SECONDS,
             )
+            if not done.wait(PUBLISH_CLOSE_TIMEOUT_SECONDS):
+                logger.warning(f"Timed out flushing events for {self.stream_name}")
+                return
 
-            # Set expiration so stream is auto-deleted after TTL
-            redis.expire(self.stream_name, STREAM_TTL_SECONDS)
-
-            logger.info(f"Closed stream {self.stream_name}")
-
-            if self._sync_redis:
-                self._sync_redis.close()
-                self._sync_redis = None
+            logger.info("Closed stream %s", self.stream_name)
         except Exception as e:
             logger.error(f"Error closing publisher: {e}", exc_info=True)
 
     async def close(self) -> None:
-        """Async wrapper for close_sync (implements EventPublisher protocol)."""
-        self.close_sync()
+        """Async wrapper for close_sync, run in a worker thread (implements EventPublisher protocol)."""
+        await asyncio.to_thread(self.close_sync)
 
 
 class RedisEventSubscriber:
@@ -351,11 +709,24 @@ class RedisEventSubscriber:
 
     XREAD Behavior:
     ---------------
-    - Blocks waiting for new events (5 second timeout)
+    - Blocks waiting for new events (up to the heartbeat interval)
+    - Re-reads without blocking after a full batch to drain bursts
     - Returns in batches for efficiency
     - Tracks last_id to resume from where we left off
     - Survives brief connection interruptions
 
+Reconnect Resume (consumer_id):
+-------------------------------
+Without a consumer_id every subscriber replays the stream from "0".
+With one, the subscriber reads via XREADGROUP using a consumer group
+private to that client ("sse:{consumer_id}") and acknowledges each event
+once yielded, so Redis keeps the client's delivery cursor. Acks are
+collected and sent as one multi-id XACK pipelined with the next read. A reconnect with
+the same consumer_id first re-delivers unacknowledged (pending) entries,
+then continues with new ones instead of replaying the whole history.
+Groups live inside the stream key and expire with it; a group created
+for a stream that doesn't exist (yet) also creates the key, with a TTL.
+
     Timeout and Heartbeats:
     -----------------------
     - Overall timeout prevents infinite waits for dead streams
@@ -365,43 +736,95 @@ class RedisEventSubscriber:
     Usage (in FastAPI SSE endpoint):
         subscriber = RedisEventSubscriber(query_id)
         async for event in subscriber.events():
-            yield f"data: {event.to_json()}\\n\\n"
+            yield event.sse_bytes
     """
 
     def __init__(
         self,
         query_id: str | UUID,
         timeout: float = 300.0,  # 5 minute overall timeout
+        consumer_id: str | None = None,  # Enables resumable delivery (see class docs)
     ) -> None:
-        self.query_id = str(query_id)
-        self.stream_name = _get_stream_name(query_id)
+        self.stream_name = _get_stream_name(str(query_id))
         self.timeout = timeout
+        self.consumer_id = consumer_id
+        self._group = f"sse:{consumer_id}" if consumer_id else None
         self._redis: Redis | None = None
-        self._last_id = "0"  # Start from beginning of stream
+        # XREAD: start from beginning of stream. XREADGROUP: "0" reads this
+        # consumer's pending entries first, then we switch to ">" (new only)
+        self._last_id: str | bytes = "0"
+        # Delivered entries not yet XACKed (sent with the next read)
+        self._acks: list[bytes] = []
+
+    @property
+    def query_id(self) -> str:
+        """Query ID derived from the stream name."""
+        return self.stream_name[len(_STREAM_PREFIX):]
 
     async def _connect(self) -> Redis:
         """Lazily connect to Redis on first use (async client)."""
         if self._redis is None:
-            self._redis = aioredis.from_url(
-                settings.redis_url,
-                decode_responses=True,
-            )
-            logger.debug(f"Connected to stream {self.stream_name}")
+            self._redis = aioredis.Redis(connection_pool=_ASYNC_POOL)
+            logger.debug("Connected to stream %s", self.stream_name)
         return self._redis
 
-    async def events(self) -> AsyncGenerator[QueryEvent, None]:
+    async def _ensure_group(self, redis: Redis) -> None:
+        """Create this client's consumer group (from the stream start) unless it exists."""
+        # MKSTREAM lets a client subscribe before the worker opens the
+        # stream. EXPIRE NX gives a key created here the stream TTL (so a
+        # resume for an unknown or expired query doesn't leave an empty
+        # stream behind) without touching the TTL of an existing stream
+        pipe = redis.pipeline(transaction=False)
+        pipe.xgroup_create(self.stream_name, self._group, id="0", mkstream=True)
+        pipe.expire(self.stream_name, STREAM_TTL_SECONDS, nx=True)
+        created, _ = await pipe.execute(raise_on_error=False)
+        if isinstance(created, Exception) and "BUSYGROUP" not in str(created):
+            raise created
+
+    async def _read(self, redis: Redis, block: int | None) -> list[Any]:
+        """Read the next batch with XREAD, or XREADGROUP when resumable."""
+        if self._group is None:
+            return await redis.xread(
+                {self.stream_name: self._last_id},
+                count=XREAD_COUNT,
+                block=block,
+            )
+        if not self._acks:
+            return await redis.xreadgroup(
+                self._group,
+                self.consumer_id,
+                {self.stream_name: self._last_id},
+                count=XREAD_COUNT,
+                # Pending-entry reads ("0") never block
+                block=block if self._last_id == ">" else None,
+            )
+        # Acknowledge the previous batch in the same round trip
+        pipe = redis.pipeline(transaction=False)
+        pipe.xack(self.stream_name, self._group, *self._acks)
+        pipe.xreadgroup(
+            self._group,
+            self.consumer_id,
+            {self.stream_name: self._last_id},
+            count=XREAD_COUNT,
+            block=block if self._last_id == ">" else None,
+        )
+        _, messages = await pipe.execute()
+        self._acks.clear()
+        return messages
+
+    async def events(self) -> AsyncGenerator[StreamEvent, None]:
         """
         Async generator that yields events from the Redis Stream.
 
         This is the main consumption loop. It:
         1. Connects to Redis
         2. Uses XREAD with blocking to wait for events
-        3. Parses and yields each event
+        3. Wraps and yields each event (data is left encoded)
         4. Sends heartbeats during idle periods
         5. Terminates on stream end sentinel or timeout
 
         Yields:
-            QueryEvent objects as they arrive
+            StreamEvent objects as they arrive (to_event() decodes one)
 
         Error Handling:
             - Redis read errors: sleep and retry
@@ -409,29 +832,29 @@ class RedisEventSubscriber:
             - Timeout: yield error event and return
         """
         redis = await self._connect()
+        if self._group is not None:
+            await self._ensure_group(redis)
         heartbeat_interval = 15.0  # Send heartbeat every 15 seconds
+        block_ms = int(heartbeat_interval * 1000)  # Wake up in time for the next heartbeat
         last_heartbeat = time.time()
         start_time = time.time()
+        drain = False  # Last batch was full: more entries are likely waiting
+        debug = logger.isEnabledFor(logging.DEBUG)  # Skip per-message log formatting
 
         try:
             while True:
                 # Check overall timeout
                 if time.time() - start_time > self.timeout:
                     logger.warning(f"Timeout reading from stream {self.stream_name}")
-                    yield QueryEvent(
-                        event=EventType.ERROR,
-                        data={"error": "Event stream timeout"},
-                        query_id=self.query_id,
+                    yield StreamEvent(
+                        EventType.ERROR, self.query_id, _utc_now_iso(), _TIMEOUT_PAYLOAD
                     )
                     break
 
-                # Read from stream with 5 second block timeout
+                # Block until events arrive (or the heartbeat is due). After a
+                # full batch, re-read without blocking to drain the backlog.
                 try:
-                    messages = await redis.xread(
-                        {self.stream_name: self._last_id},
-                        count=10,  # Process up to 10 messages per iteration
-                        block=5000,  # 5 second block timeout
-                    )
+                    messages = await self._read(redis, None if drain else block_ms)
                 except Exception as e:
                     logger.error(f"Error reading stream {self.stream_name}: {e}")
                     await asyncio.sleep(1)  # Brief pause before retry
@@ -439,50 +862,81 @@ class RedisEventSubscriber:
 
                 current_time = time.time()
 
+                # We only read a single stream, so a batch is always
+                # messages[0] -> (stream_name, entries).
+                stream_messages = messages[0][1] if messages else []
+
                 # No messages - check if heartbeat needed
-                if not messages:
+                if not stream_messages:
+                    drain = False
+                    if self._group is not None and self._last_id != ">":
+                        self._last_id = ">"  # Pending backlog replayed; wait for new entries
+                        continue
                     if current_time - last_heartbeat >= heartbeat_interval:
-                        yield QueryEvent(
-                            event=EventType.HEARTBEAT,
-                            data={},
-                            query_id=self.query_id,
+                        yield StreamEvent(
+                            EventType.HEARTBEAT, self.query_id, _utc_now_iso(), b"{}"
                         )
                         last_heartbeat = current_time
                     continue
 
                 # Process received messages
-                logger.info(f"Received {len(messages)} message batches from stream {self.stream_name}")
-                for stream_name, stream_messages in messages:
-                    logger.info(f"Processing {len(stream_messages)} messages from {stream_name}")
-                    for message_id, message_data in stream_messages:
+                drain = len(stream_messages) >= XREAD_COUNT
+                if debug:
+                    logger.debug("Processing %d messages from %s", len(stream_messages), self.stream_name)
+                for message_id, message_data in stream_messages:
+                    if self._last_id != ">":
                         self._last_id = message_id  # Track position for resumption
-                        logger.debug(f"Processing message {message_id}: {message_data}")
-
-                        try:
-                            event_json = message_data.get("event", "{}")
-                            event = QueryEvent.from_json(event_json)
-
-                            logger.info(f"Parsed event: {event.event.value}")
-
-                            # Check for stream end sentinel
-                            if event.data.get("_stream_end"):
-                                logger.info(f"Stream end received for {self.query_id}")
-                                return  # Exit generator cleanly
-
-                            yield event
-
-                        except Exception as e:
-                            logger.error(f"Error parsing event from {message_id}: {e}, data: {message_data}")
-                            continue  # Skip malformed events
+                    if debug:
+                        logger.debug("Processing message %s: %s", message_id, message_data)
+
+                    # Pending entries already trimmed by MAXLEN come back
+                    # with nil fields on a "0" (resume) read
+                    if not message_data or b"t" not in message_data:
+                        self._ack(message_id)
+                        continue  # Stream-open placeholder, not an event
+
+                    try:
+                        event = StreamEvent.from_stream_fields(message_data)
+                    except Exception as e:
+                        logger.error(f"Error parsing event from {message_id}: {e}, data: {message_data}")
+                        self._ack(message_id)
+                        continue  # Skip malformed events
+
+                    if debug:
+                        logger.debug("Parsed event: %s", event.event.value)
+
+                    # Check for stream end sentinel (byte comparison, no JSON parse)
+                    if event.payload == _STREAM_END_PAYLOAD:
+                        logger.debug("Stream end received for %s", self.query_id)
+                        self._ack(message_id)
+                        return  # Exit generator cleanly
+
+                    yield event
+                    # Resumed by the consumer, so the event was handed off
+                    self._ack(message_id)
 
         finally:
+            await self._flush_acks(redis)
             await self.close()
 
+    def _ack(self, message_id: bytes) -> None:
+        """Mark a delivered entry for acknowledgement (no-op without a consumer group)."""
+        if self._group is not None:
+            self._acks.append(message_id)
+
+    async def _flush_acks(self, redis: Redis) -> None:
+        """XACK entries delivered since the last read (best effort; unacked entries are re-sent on resume)."""
+        if not self._acks:
+            return
+        try:
+            await redis.xack(self.stream_name, self._group, *self._acks)
+        except Exception as e:
+            logger.warning(f"Failed to acknowledge events on {self.stream_name}: {e}")
+        self._acks.clear()
+
     async def close(self) -> None:
-        """Close Redis connection and cleanup."""
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the client; connections stay in the shared pool."""
+        self._redis = None
 
 
 class EventEmitter:
@@ -513,11 +967,19 @@ class EventEmitter:
     """
 
     def __init__(self, publisher: EventPublisher, query_id: str | UUID):
-        self.query_id = str(query_id)
+        # Interned once; every event of this emitter shares the same string,
+        # and the raw path reuses its pre-encoded bytes
+        self.query_id = sys.intern(str(query_id))
+        self._query_id_bytes = self.query_id.encode()
         self.publisher = publisher
+        # Resolved once: publishers that take raw payloads skip QueryEvent entirely
+        self._publish_raw = getattr(publisher, "publish_raw", None)
 
     async def emit(self, event: EventType, **data) -> None:
         """Low-level emit - prefer using typed methods below."""
+        if self._publish_raw is not None:
+            await self._publish_raw(event, _event_fields(event, data, self._query_id_bytes, _utc_now_iso()))
+            return
         query_event = QueryEvent(
             event=event,
             data=data,
@@ -29,23 +29,46 @@ These fields exist on Document/Section models, but we copy them here because:
 2. Faster queries without JOINs for history listing
 3. Historical accuracy - captures the title AT TIME OF EDIT
 
+Content Compression:
+--------------------
+old_content/new_content are CompressedText columns: zstd-compressed
+BYTEA that the ORM (and Core inserts) transparently turn back into str.
+
+Partitioning and Retention:
+---------------------------
+edit_history is range-partitioned by month on created_at. A nightly
+Celery beat task (maintain_partitions) creates upcoming partitions and
+drops whole months past settings.history_retention_months, so retention
+is a cheap DROP TABLE rather than a large DELETE. Date-bounded queries
+only touch the matching partitions.
+
 Production Considerations:
 --------------------------
-- Add retention policy (auto-delete after N days/months)
-- Consider partitioning by date for large tables
-- Add compression for old_content/new_content (can be large)
 - Index on created_at for time-range queries
 """
 
 import logging
+import re
+from datetime import date, datetime
 from typing import Sequence
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.history import EditHistory, UserAction
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.history import (
+    HISTORY_PARTITIONS_AHEAD,
+    EditHistory,
+    UserAction,
+    ensure_history_partitions,
+    is_history_partitioned,
+    next_month,
+)
 
 logger = logging.getLogger(__name__)
 
+_MONTHLY_PARTITION_RE = re.compile(r"^edit_history_y(\d{4})m(\d{2})$")
+
 
 class HistoryService:
     """
@@ -163,17 +186,25 @@ class HistoryService:
 
     async def get_section_history(
         self,
-        section_id: UUID
+        section_id: UUID,
+        limit: int = 200,
+        after: tuple[datetime, UUID] | None = None,
     ) -> Sequence[EditHistory]:
         """
         Get edit history for a specific section.
 
-        Returns all edits to a single section, useful for
-        understanding how a particular piece of content evolved.
-        No limit applied - sections typically have fewer edits.
+        Returns edits to a single section, useful for understanding
+        how a particular piece of content evolved. Pages are fetched
+        with a (created_at, id) keyset instead of OFFSET, so each page is
+        a range scan on ix_edit_history_section_created no matter how
+        deep it is. The id breaks ties between entries written in one
+        transaction, which share created_at (now()).
 
         Args:
             section_id: UUID of the section to query
+            limit: Maximum entries to return (default 200)
+            after: (created_at, id) of the last entry of the previous
+                page; only entries after it (newest first) are returned
 
         Returns:
             List of EditHistory records for this section, newest first
@@ -183,9 +214,66 @@ class HistoryService:
             - Diff view showing section evolution
             - Rollback to previous version
         """
+        stmt = select(EditHistory).where(EditHistory.section_id == section_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(EditHistory.created_at, EditHistory.id) < after)
         result = await self.db.execute(
-            select(EditHistory)
-            .where(EditHistory.section_id == section_id)
-            .order_by(EditHistory.created_at.desc())
+            stmt.order_by(EditHistory.created_at.desc(), EditHistory.id.desc()).limit(limit)
         )
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().all()
+
+    async def maintain_partitions(
+        self,
+        months_ahead: int = HISTORY_PARTITIONS_AHEAD,
+        retention_months: int | None = None,
+    ) -> list[str]:
+        """
+        Create upcoming monthly partitions and drop expired ones.
+
+        Args:
+            months_ahead: Months of partitions to keep created ahead of now
+            retention_months: Whole months to keep (default:
+                settings.history_retention_months; 0 keeps everything)
+
+        Returns:
+            Names of the dropped partitions
+        """
+        def ensure(session: Session) -> bool:
+            connection = session.connection()
+            if not is_history_partitioned(connection):
+                return False
+            ensure_history_partitions(connection, months_ahead)
+            return True
+
+        if not await self.db.run_sync(ensure):
+            # Created before partitioning (create_all doesn't alter existing
+            # tables): there are no partitions to create or drop
+            logger.warning("edit_history is not partitioned; skipping partition maintenance")
+            return []
+
+        if retention_months is None:
+            retention_months = settings.history_retention_months
+        if retention_months <= 0:
+            return []
+
+        # First day of the oldest month kept
+        month_index = date.today().year * 12 + date.today().month - 1 - retention_months
+        cutoff = date(month_index // 12, month_index % 12 + 1, 1)
+
+        result = await self.db.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ), {"table": EditHistory.__tablename__})
+
+        dropped: list[str] = []
+        for name in result.scalars():
+            match = _MONTHLY_PARTITION_RE.match(name)
+            if match and next_month(date(int(match[1]), int(match[2]), 1)) <= cutoff:
+                await self.db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+
+        if dropped:
+            logger.info(f"Dropped expired edit history partitions: {', '.join(dropped)}")
+        return dropped
@@ -10,7 +10,8 @@ How Vector Search Works:
 1. Document sections are converted to vectors (embeddings) using OpenAI
 2. Vectors are stored in ChromaDB with metadata
 3. Search queries are also converted to vectors
-4. ChromaDB finds sections with similar vectors (cosine similarity)
+4. ChromaDB finds sections with similar vectors (cosine similarity,
+   computed as a plain inner product since embeddings are stored unit-length)
 
 Why ChromaDB?
 -------------
@@ -34,9 +35,27 @@ Cost Considerations:
 - 10K sections = ~$0.10 to embed
 - Consider batching embeddings and caching frequently searched queries
 
+Embedding Cache:
+----------------
+Embeddings are cached in Redis as packed float16 bytes under
+"emb:f16:{model}:{sha256(text)}", so repeated search queries and re-indexed
+unchanged sections (e.g. every re-seed after a deploy) skip the OpenAI call.
+Keys are content-addressed, so they never go stale; a hit renews the entry's
+EMBEDDING_CACHE_TTL_SECONDS, and only unused entries expire.
+Cache errors are logged and never fail a request. A per-process LRU of
+the most recent EMBEDDING_LRU_SIZE entries sits in front of Redis, and
+concurrent _get_embedding calls for the same text share one request.
+
+Async I/O:
+----------
+All Chroma access goes through chromadb.AsyncHttpClient, so a slow Chroma
+request never stalls the event loop and concurrent searches/upserts
+overlap on the wire. Every collection method here is therefore async,
+including the maintenance helpers (clear_collection, list_all_ids, ...).
+Tokenizing long batch inputs runs in a worker thread (asyncio.to_thread).
+
 Production Considerations:
 --------------------------
-- Implement embedding cache (Redis) for repeated content
 - Add retry logic for OpenAI API failures (already done via tenacity)
 - Monitor ChromaDB memory usage
 - Consider async embedding generation for bulk imports
@@ -44,8 +63,14 @@ Production Considerations:
 """
 
 from __future__ import annotations
+import asyncio
+import base64
+import hashlib
 import logging
-from typing import Any, TypedDict, NotRequired
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterator, Sequence, TypedDict, NotRequired
 from uuid import UUID
 
 
@@ -58,9 +83,15 @@ class SearchResultDict(TypedDict):
 
 
 import chromadb
-from chromadb.api.models.Collection import Collection
-from chromadb.errors import ChromaError
-from openai import AsyncOpenAI
+import httpx
+import numpy as np
+import redis.asyncio as aioredis
+import tiktoken
+from chromadb.api import AsyncClientAPI
+from chromadb.api.models.AsyncCollection import AsyncCollection
+from chromadb.config import Settings as ChromaSettings
+from chromadb.errors import ChromaError, NotFoundError
+from openai import AsyncOpenAI, RateLimitError
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -72,6 +103,97 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Cached embeddings expire 30 days after they were last read or written, so
+# content that keeps being indexed or searched never has to be re-embedded
+EMBEDDING_CACHE_TTL_SECONDS = 86400 * 30
+
+# Redis stores embeddings at half precision: half the memory and transfer of
+# float32, and well below the noise floor for cosine ranking of unit vectors.
+# Rounding moves the norm slightly off 1, so decoded vectors are normalized
+# again before they reach the ip-space collection (see _decode_cached_embedding)
+EMBEDDING_CACHE_DTYPE = np.float16
+
+# OpenAI rejects embedding inputs over 8191 tokens; longer texts are cut
+# to that many tokens. MAX_EMBEDDING_CHARS is the fallback cap when no
+# tokenizer is available for the model.
+MAX_EMBEDDING_TOKENS = 8191
+MAX_EMBEDDING_CHARS = 8000
+
+# OpenAI also caps the total tokens of one embeddings request (300k); batches
+# stay under this estimate (~4 chars per token) with room for misestimates
+MAX_EMBEDDING_BATCH_TOKENS = 200_000
+
+# HNSW index settings, applied when the collection is created. Searches ask
+# for at most 20 neighbours, so search_ef=64 keeps recall high with fewer
+# graph hops than Chroma's default of 100; the higher construction_ef buys
+# a better-connected graph once, at index time. Embeddings are normalized
+# before they are stored or queried, so inner product equals cosine
+# similarity without Chroma's per-comparison normalization
+# (ip distance = 1 - dot, so score = 1 - distance still holds).
+COLLECTION_METADATA = {
+    "hnsw:space": "ip",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
+
+# Chroma HTTP pool. Concurrent coroutines can have many calls in flight
+# at once; keep enough idle connections alive that bursts reuse them
+# instead of reconnecting (httpx keeps only 20)
+CHROMA_MAX_CONNECTIONS = 100
+CHROMA_MAX_KEEPALIVE_CONNECTIONS = 40
+CHROMA_KEEPALIVE_SECONDS = 30.0
+
+# OpenAI HTTP pool: sized for openai_embedding_concurrency-wide bursts from several
+# concurrent callers; HTTP/2 multiplexes those requests over few connections
+OPENAI_MAX_CONNECTIONS = 200
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 50
+OPENAI_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# A rate-limited embedding batch is split in half and retried, at most this
+# many times, doubling the pause each time
+EMBEDDING_RATE_LIMIT_RETRIES = 4
+EMBEDDING_RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# add_section coalescing: max sections per flushed batch (Chroma recommends
+# 50-250 per upsert) and how long the flusher lingers for more callers
+ADD_SECTION_BATCH_SIZE = 250
+ADD_SECTION_LINGER_SECONDS = 0.01
+
+# In-process LRU in front of the Redis cache (~6 KB per entry at 1536 dims)
+EMBEDDING_LRU_SIZE = 2048
+
+# Metadata value types Chroma stores as-is; anything else is stringified
+_METADATA_PRIMITIVES = frozenset({str, int, float, bool})
+
+# get_collection_stats() reuses a count this recent. This instance's own
+# writes reset it at once; writes from other processes show up within this
+COLLECTION_COUNT_TTL_SECONDS = 10.0
+
+# Collection methods that can change the count
+_COLLECTION_WRITES = frozenset({"add", "upsert", "update", "delete"})
+
+# Where clause template for each (file_path filter set, document_id filter set)
+# combination, so building one is a single lookup and dict literal. Each call
+# builds a fresh dict: callers (and Chroma) may hold or mutate what they get
+_WHERE_CLAUSE_BUILDERS: dict[
+    tuple[bool, bool], Callable[[str | None, str | None], dict[str, Any] | None]
+] = {
+    (False, False): lambda file_path, document_id: None,
+    (True, False): lambda file_path, document_id: {"file_path": {"$eq": file_path}},
+    (False, True): lambda file_path, document_id: {"document_id": {"$eq": document_id}},
+    (True, True): lambda file_path, document_id: {
+        "$and": [
+            {"file_path": {"$eq": file_path}},
+            {"document_id": {"$eq": document_id}},
+        ]
+    },
+}
+
+# Embeddings are float32 vectors (4 bytes/dim vs ~32 for a Python float in a
+# list), passed to Chroma and the cache as arrays without conversion
+Embedding = np.ndarray
+
 class SearchServiceError(Exception):
     pass
 
@@ -81,24 +203,37 @@ class EmbeddingError(SearchServiceError):
 class VectorStoreError(SearchServiceError):
     pass
 
+SectionItem = tuple[str | UUID, str, dict[str, Any] | None]
+
 class SearchService:
-    def __init__(self) -> None:
-        self._openai = AsyncOpenAI(api_key=settings.openai_api_key)
-        self._chroma: chromadb.HttpClient | None = None
-        self._collection: Collection | None = None
+    def __init__(self, openai_client: AsyncOpenAI | None = None) -> None:
+        self._openai = openai_client
+        self._inflight: dict[str, asyncio.Task[Embedding]] = {}
+        self._pending: asyncio.Queue[tuple[SectionItem, asyncio.Future[str]]] | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self._chroma: AsyncClientAPI | None = None
+        self._collection: AsyncCollection | None = None
         self._initialized = False
+        self._redis: aioredis.Redis | None = None
+        self._embedding_slots: asyncio.Semaphore | None = None
+        self._count: tuple[float, int] | None = None  # (monotonic time, count)
 
-    def _ensure_initialized(self) -> None:
+    async def _ensure_initialized(self) -> None:
         if self._initialized:
             return
         try:
-            self._chroma = chromadb.HttpClient(
+            self._chroma = await chromadb.AsyncHttpClient(
                 host=settings.chroma_host,
                 port=settings.chroma_port,
+                settings=ChromaSettings(
+                    chroma_http_keepalive_secs=CHROMA_KEEPALIVE_SECONDS,
+                    chroma_http_max_connections=CHROMA_MAX_CONNECTIONS,
+                    chroma_http_max_keepalive_connections=CHROMA_MAX_KEEPALIVE_CONNECTIONS,
+                ),
             )
-            self._collection = self._chroma.get_or_create_collection(
+            self._collection = await self._chroma.get_or_create_collection(
                 name=settings.chroma_collection_name,
-                metadata={"hnsw:space": "cosine"},
+                metadata=COLLECTION_METADATA,
             )
             self._initialized = True
             logger.info("ChromaDB connection established")
@@ -106,36 +241,203 @@ class SearchService:
             logger.error(f"Failed to connect to ChromaDB: {e}")
             raise VectorStoreError(f"ChromaDB connection failed: {e}") from e
 
+    async def _get_collection(self) -> AsyncCollection:
+        """
+        Return the collection, connecting on first use.
+
+        Callers bind the result to a local once per call; after the first
+        connect this is a single attribute check.
+        """
+        collection = self._collection
+        if collection is None:
+            await self._ensure_initialized()
+            collection = self._collection
+            if collection is None:
+                raise VectorStoreError("Collection not initialized")
+        return collection
+
+    async def _collection_call(self, collection: AsyncCollection, method: str, **kwargs: Any) -> Any:
+        """
+        Call a collection method, re-resolving the collection once if it
+        was dropped and recreated since (clear_collection, possibly in
+        another process) and this instance still holds the old handle.
+        """
+        if method in _COLLECTION_WRITES:
+            self._count = None
+        try:
+            return await getattr(collection, method)(**kwargs)
+        except NotFoundError:
+            if self._collection is collection:
+                self._initialized = False
+                self._collection = None
+            return await getattr(await self._get_collection(), method)(**kwargs)
+
+    def _get_openai(self) -> AsyncOpenAI:
+        # Looked up per call rather than in __init__, so importing the module
+        # builds no HTTP pool and a pool closed at shutdown is never reused
+        return self._openai or _shared_openai_client()
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.Redis.from_url(settings.redis_url)
+        return self._redis
+
+    def _get_embedding_slots(self) -> asyncio.Semaphore:
+        if self._embedding_slots is None:
+            self._embedding_slots = asyncio.Semaphore(settings.openai_embedding_concurrency)
+        return self._embedding_slots
+
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return f"emb:f16:{settings.openai_embedding_model}:{digest}"
+
+    async def _cache_get(self, texts: list[str]) -> list[Embedding | None]:
+        """Look up cached embeddings for (already truncated) texts; None marks a miss."""
+        keys = [self._cache_key(t) for t in texts]
+        embeddings = [_lru_get(key) for key in keys]
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not misses:
+            return embeddings
+        try:
+            # GETEX renews the TTL of each hit in the same round trip
+            pipe = self._get_redis().pipeline(transaction=False)
+            for i in misses:
+                pipe.getex(keys[i], ex=EMBEDDING_CACHE_TTL_SECONDS)
+            raw = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return embeddings
+        for i, value in zip(misses, raw):
+            if value is not None:
+                embeddings[i] = _decode_cached_embedding(value)
+                _lru_put(keys[i], embeddings[i])
+        return embeddings
+
+    async def _cache_set(self, texts: list[str], embeddings: Sequence[Embedding]) -> None:
+        keys = [self._cache_key(t) for t in texts]
+        for key, embedding in zip(keys, embeddings):
+            _lru_put(key, embedding)
+        try:
+            pipe = self._get_redis().pipeline(transaction=False)
+            for key, embedding in zip(keys, embeddings):
+                pipe.set(key, _encode_cached_embedding(embedding), ex=EMBEDDING_CACHE_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    async def _get_embedding(self, text: str) -> Embedding:
+        text = _truncate_for_embedding(text)
+        key = self._cache_key(text)
+        # Repeated queries are usually in the in-process LRU: answer those
+        # without creating a task or yielding to the event loop
+        cached = _lru_get(key)
+        if cached is not None:
+            return cached
+        # Single-flight: concurrent requests for the same text (e.g. a
+        # popular search) wait on the first caller's lookup
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._get_embedding_uncoalesced(text))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get_embedding_uncoalesced(self, text: str) -> Embedding:
+        cached = (await self._cache_get([text]))[0]
+        if cached is not None:
+            return cached
+        embedding = await self._create_embedding(text)
+        await self._cache_set([text], [embedding])
+        return embedding
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type((TimeoutError, ConnectionError)),
     )
-    async def _get_embedding(self, text: str) -> list[float]:
+    async def _create_embedding(self, text: str) -> Embedding:
         try:
-            response = await self._openai.embeddings.create(
+            response = await self._get_openai().embeddings.create(
                 model=settings.openai_embedding_model,
-                input=text[:8000], 
+                input=text,
+                encoding_format="base64",
             )
-            return response.data[0].embedding
+            return _normalize(_decode_embeddings(response.data)[0])
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             raise EmbeddingError(f"Failed to generate embedding: {e}") from e
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception_type((TimeoutError, ConnectionError)),
+    )
+    async def _create_embeddings(self, texts: list[str]) -> np.ndarray:
+        response = await self._get_openai().embeddings.create(
+            model=settings.openai_embedding_model,
+            input=texts,
+            encoding_format="base64",
+        )
+        return _normalize(_decode_embeddings(response.data))
+
     async def _get_embeddings_batch(
         self,
         texts: list[str],
         batch_size: int = 100,
-    ) -> list[list[float]]:
-        embeddings: list[list[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = [t[:8000] for t in texts[i : i + batch_size]]
-            response = await self._openai.embeddings.create(
-                model=settings.openai_embedding_model,
-                input=batch,
-            )
-            embeddings.extend([d.embedding for d in response.data])
-        return embeddings
+    ) -> np.ndarray:
+        """Embed texts into one (len(texts), dim) float32 array, in input order."""
+        # Sections often share boilerplate (headers, disclaimers): look up and
+        # embed each distinct text once, then fan the rows back out
+        if any(len(t) * 4 > MAX_EMBEDDING_TOKENS for t in texts):
+            # Some text may need tokenizing: CPU work that tiktoken runs
+            # without the GIL, so keep it off the event loop
+            texts = await asyncio.to_thread(lambda: [_truncate_for_embedding(t) for t in texts])
+        index_of = {text: i for i, text in enumerate(dict.fromkeys(texts))}
+        unique = list(index_of)
+
+        embeddings = await self._cache_get(unique)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        # Batches are independent network calls: run them concurrently, with
+        # at most settings.openai_embedding_concurrency in flight across all
+        # of this service's callers (kept under the account's rate limit),
+        # not per call, so concurrent indexing jobs can't multiply it
+        semaphore = self._get_embedding_slots()
+
+        async def embed(indices: list[int], attempt: int = 0) -> None:
+            batch = [unique[i] for i in indices]
+            try:
+                async with semaphore:
+                    created = await self._create_embeddings(batch)
+            except RateLimitError:
+                if attempt >= EMBEDDING_RATE_LIMIT_RETRIES:
+                    raise
+                # Back off (without holding a slot), then retry each half on
+                # its own: other batches keep their results, and smaller
+                # requests probe how much the rate limit still allows
+                await asyncio.sleep(EMBEDDING_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt)
+                middle = (len(indices) + 1) // 2
+                await asyncio.gather(*(
+                    embed(half, attempt + 1)
+                    for half in (indices[:middle], indices[middle:])
+                    if half
+                ))
+                return
+            for i, embedding in zip(indices, created):
+                embeddings[i] = embedding
+            await self._cache_set(batch, created)
+
+        await asyncio.gather(*(
+            embed(batch) for batch in _length_sorted_batches(unique, misses, batch_size)
+        ))
+
+        if not embeddings:
+            return np.empty((0, 0), dtype=np.float32)
+        rows = np.vstack(embeddings)  # type: ignore[arg-type]  # every miss was filled
+        if len(unique) == len(texts):
+            return rows
+        return rows[[index_of[text] for text in texts]]
 
     async def search(
         self,
@@ -146,46 +448,78 @@ class SearchService:
         document_id_filter: str | None = None,
         min_score: float | None = None,
     ) -> list[SearchResultDict]:
-        self._ensure_initialized()
-        if self._collection is None:
-            raise VectorStoreError("Collection not initialized")
+        return [
+            result
+            async for result in self.search_stream(
+                query,
+                n_results=n_results,
+                where=where,
+                file_path_filter=file_path_filter,
+                document_id_filter=document_id_filter,
+                min_score=min_score,
+            )
+        ]
 
-        chroma_where = where
+    async def search_stream(
+        self,
+        query: str,
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+        file_path_filter: str | None = None,
+        document_id_filter: str | None = None,
+        min_score: float | None = None,
+    ) -> AsyncIterator[SearchResultDict]:
+        """
+        Like search(), but yields results best-first as they are built.
 
-        if not chroma_where:
-            chroma_where = self._build_where_clause(file_path_filter, document_id_filter)
+        Chroma returns all matches in one response, so this saves building
+        the full result list: a consumer streaming results (e.g. to the UI)
+        can forward each one immediately and stop early.
+        """
+        # Start the embedding round-trip first so the Chroma connect (on a
+        # cold instance) and the where-clause build overlap with it.
+        # Whitespace is collapsed so trivially different spellings of a
+        # query share one cached embedding (case is kept: it can change meaning)
+        embedding_task = asyncio.ensure_future(self._get_embedding(" ".join(query.split())))
+        try:
+            collection = await self._get_collection()
+        except BaseException:
+            embedding_task.cancel()
+            raise
 
-        query_embedding = await self._get_embedding(query)
+        chroma_where = where or None
+
+        if not chroma_where and (file_path_filter or document_id_filter):
+            chroma_where = self._build_where_clause(
+                file_path_filter,
+                str(document_id_filter) if document_id_filter else None,
+            )
+
+        query_embedding = await embedding_task
 
         try:
-            results = self._collection.query(
+            results = await self._collection_call(
+                collection,
+                "query",
                 query_embeddings=[query_embedding],
                 n_results=min(n_results, 20),
                 where=chroma_where,
                 include=["documents", "metadatas", "distances"],
             )
-            return self._format_results(results, min_score)
         except ChromaError as e:
             logger.error(f"Chroma search failed: {e}")
             raise VectorStoreError(f"Search failed: {e}") from e
 
+        for result in self._iter_results(results, min_score):
+            yield result
+
+    @staticmethod
     def _build_where_clause(
-        self,
         file_path_filter: str | None,
         document_id_filter: str | None,
     ) -> dict[str, Any] | None:
-        clauses: list[dict[str, Any]] = []
-        
-        if file_path_filter:
-            clauses.append({"file_path": {"$eq": file_path_filter}})
-        if document_id_filter:
-            clauses.append({"document_id": {"$eq": str(document_id_filter)}})
-
-        if not clauses:
-            return None
-        if len(clauses) == 1:
-            return clauses[0]
-        return {"$and": clauses}
+        build = _WHERE_CLAUSE_BUILDERS[bool(file_path_filter), bool(document_id_filter)]
+        return build(file_path_filter, document_id_filter)
 
     async def search_by_file_path(
         self,
@@ -199,106 +533,382 @@ class SearchService:
             where={"file_path": {"$eq": path_pattern}} 
         )
 
-    def _format_results(
+    def _iter_results(
         self,
         results: dict[str, Any],
         min_score: float | None,
-    ) -> list[SearchResultDict]:
-        formatted: list[SearchResultDict] = []
-
+    ) -> Iterator[SearchResultDict]:
         if not results.get("ids") or not results["ids"][0]:
-            return formatted
+            return
 
         ids = results["ids"][0]
-        documents = results.get("documents", [[]])[0]
-        metadatas = results.get("metadatas", [[]])[0]
-        distances = results.get("distances", [[]])[0]
+        n = len(ids)
+        documents = results["documents"][0]
+        metadatas = results["metadatas"][0]
+        scores = 1.0 - np.asarray(results["distances"][0], dtype=np.float64)
+        keep = np.arange(n) if min_score is None else np.flatnonzero(scores >= min_score)
+
+        # Round only the survivors, in one vectorized call. Sections stored
+        # without metadata come back as None
+        for i, score in zip(keep.tolist(), np.round(scores[keep], 4).tolist()):
+            yield {
+                "section_id": ids[i],
+                "content": documents[i],
+                "metadata": metadatas[i] or {},
+                "score": score,
+            }
 
-        for i, section_id in enumerate(ids):
-            distance = distances[i] if i < len(distances) else 0.0
-            score = 1.0 - distance 
+    async def add_section(self, section_id: str | UUID, content: str, metadata: dict[str, Any] | None = None) -> str:
+        """
+        Embed and upsert one section.
 
-            if min_score is not None and score < min_score:
+        Calls are queued and a background flusher coalesces whatever
+        arrives together (e.g. concurrent requests on the shared
+        search_service) into one add_sections_batch call of up to
+        ADD_SECTION_BATCH_SIZE sections.
+        """
+        loop = asyncio.get_running_loop()
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not loop:
+            # Celery tasks run each coroutine on a fresh loop (run_async)
+            self._pending = asyncio.Queue()
+            self._flusher = loop.create_task(self._flush_sections(self._pending))
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.put_nowait(((section_id, content, metadata), future))  # type: ignore[union-attr]
+        return await future
+
+    async def _flush_sections(
+        self,
+        queue: asyncio.Queue[tuple[SectionItem, asyncio.Future[str]]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + ADD_SECTION_LINGER_SECONDS
+            while len(batch) < ADD_SECTION_BATCH_SIZE:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), deadline - loop.time()))
+                except TimeoutError:
+                    break
+
+            # Chroma rejects duplicate IDs within one upsert: last write wins
+            latest = {str(item[0]): item for item, _ in batch}
+            try:
+                await self.add_sections_batch(list(latest.values()), batch_size=ADD_SECTION_BATCH_SIZE)
+            except BaseException as e:
+                # Cancelled by close(): don't leave this batch's callers hanging
+                error = e if isinstance(e, Exception) else VectorStoreError("SearchService closed")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                if error is not e:
+                    raise
                 continue
+            for item, future in batch:
+                if not future.done():
+                    future.set_result(str(item[0]))
 
-            formatted.append({
-                "section_id": section_id,
-                "content": documents[i] if i < len(documents) else None,
-                "metadata": metadatas[i] if i < len(metadatas) else {},
-                "score": round(score, 4),
-            })
+    async def add_sections_batch(
+        self,
+        items: list[SectionItem],
+        batch_size: int = 100,
+    ) -> list[str]:
+        """
+        Embed and upsert many sections with one OpenAI call and one Chroma
+        write per chunk of `batch_size` items.
 
-        return formatted
-    
-    async def add_section(self, section_id: str | UUID, content: str, metadata: dict[str, Any] | None = None) -> str:
-        self._ensure_initialized()
-        section_id_str = str(section_id)
-        embedding = await self._get_embedding(content)
-        clean_meta = {k: (str(v) if not isinstance(v, (str, int, float, bool)) else v) for k, v in (metadata or {}).items() if v is not None}
-        self._collection.upsert(ids=[section_id_str], embeddings=[embedding], documents=[content], metadatas=[clean_meta] if clean_meta else None)
-        return section_id_str
-
-    def get_collection_stats(self) -> dict[str, Any]:
-        self._ensure_initialized()
-        count = self._collection.count() if self._collection else 0
+        Args:
+            items: (section_id, content, metadata) tuples
+            batch_size: Sections per embedding request / upsert (OpenAI caps inputs at 2048)
+
+        Returns:
+            The section IDs (as strings), in input order
+        """
+        collection = await self._get_collection()
+        section_ids: list[str] = []
+        for i in range(0, len(items), batch_size):
+            chunk = items[i : i + batch_size]
+            ids = [str(section_id) for section_id, _, _ in chunk]
+            documents = [content for _, content, _ in chunk]
+            embeddings = await self._get_embeddings_batch(documents, batch_size=batch_size)
+            metadatas = [self._clean_metadata(metadata) for _, _, metadata in chunk]
+            if all(metadatas):
+                upserts = [(ids, embeddings, documents, metadatas)]
+            elif not any(metadatas):
+                upserts = [(ids, embeddings, documents, None)]
+            else:
+                # Chroma validates each metadata as a non-empty dict, so
+                # sections without any go in their own upsert that omits
+                # metadatas altogether (as a single add_section call does)
+                rows = [j for j, metadata in enumerate(metadatas) if metadata]
+                bare = [j for j, metadata in enumerate(metadatas) if not metadata]
+                upserts = [
+                    (
+                        [ids[j] for j in rows],
+                        embeddings[rows],
+                        [documents[j] for j in rows],
+                        [metadatas[j] for j in rows],
+                    ),
+                    ([ids[j] for j in bare], embeddings[bare], [documents[j] for j in bare], None),
+                ]
+            for upsert_ids, upsert_embeddings, upsert_documents, upsert_metadatas in upserts:
+                await self._collection_call(
+                    collection,
+                    "upsert",
+                    ids=upsert_ids,
+                    embeddings=upsert_embeddings,
+                    documents=upsert_documents,
+                    metadatas=upsert_metadatas,
+                )
+            section_ids.extend(ids)
+        return section_ids
+
+    @staticmethod
+    def _clean_metadata(
+        metadata: dict[str, Any] | None,
+        _prims: frozenset[type] = _METADATA_PRIMITIVES,
+        _prim_tuple: tuple[type, ...] = tuple(_METADATA_PRIMITIVES),
+        _str: type[str] = str,
+    ) -> dict[str, Any]:
+        """Drop None values and stringify anything Chroma can't store."""
+        if not metadata:
+            return {}
+        # Exact type lookup in a set short-circuits the common case; the
+        # isinstance() fallback only runs for subclasses (e.g. str enums)
+        return {
+            k: v if type(v) in _prims or isinstance(v, _prim_tuple) else _str(v)
+            for k, v in metadata.items()
+            if v is not None
+        }
+
+    async def get_collection_stats(self) -> dict[str, Any]:
+        # count() aggregates over the whole collection server-side; stats
+        # and health polls reuse a recent result instead
+        now = time.monotonic()
+        if self._count is None or now - self._count[0] > COLLECTION_COUNT_TTL_SECONDS:
+            count = await self._collection_call(await self._get_collection(), "count")
+            self._count = (now, count)
+        else:
+            await self._get_collection()  # Stats report whether Chroma is reachable
+            count = self._count[1]
         return {"name": settings.chroma_collection_name, "count": count, "initialized": self._initialized}
 
-    def clear_collection(self) -> None:
-        self._ensure_initialized()
-        results = self._collection.get(include=[])
-        if results["ids"]: self._collection.delete(ids=results["ids"])
+    async def clear_collection(self) -> None:
+        """
+        Remove every embedding by dropping and recreating the collection.
+
+        Two small RPCs instead of fetching every ID only to send them all
+        back in a delete. Instances elsewhere that still hold the old
+        collection re-resolve it on their next call (_collection_call).
+        """
+        await self._get_collection()  # connects self._chroma
+        try:
+            await self._chroma.delete_collection(settings.chroma_collection_name)  # type: ignore[union-attr]
+        except NotFoundError:
+            pass  # Already dropped elsewhere
+        self._initialized = False
+        self._collection = None
+        await self._get_collection()
+        self._count = (time.monotonic(), 0)
 
-    def list_all_ids(self) -> list[str]:
+    async def list_all_ids(self) -> list[str]:
         """Return all embedding IDs in the collection."""
-        self._ensure_initialized()
-        if self._collection is None:
-            return []
-        results = self._collection.get(include=[])
+        results = await self._collection_call(await self._get_collection(), "get", include=[])
         return results.get("ids", [])
 
-    def delete_ids(self, ids: list[str]) -> int:
+    async def delete_ids(self, ids: list[str]) -> int:
         """Delete embeddings by IDs. Returns count of deleted."""
         if not ids:
             return 0
-        self._ensure_initialized()
-        if self._collection is None:
-            return 0
-        self._collection.delete(ids=ids)
+        await self._collection_call(await self._get_collection(), "delete", ids=ids)
         return len(ids)
 
-    async def delete_by_document(self, document_id: str) -> int:
+    async def delete_by_document(self, document_id: str, count: bool = False) -> int | None:
         """
         Delete all embeddings belonging to a specific document.
 
+        Deletes by metadata filter in a single Chroma call. Chroma doesn't
+        report how many entries a delete removed, so counting costs an
+        extra lookup and is opt-in.
+
         Args:
             document_id: The document UUID to delete embeddings for
+            count: Also return the number of deleted embeddings
 
         Returns:
-            Number of embeddings deleted
+            Number of embeddings deleted if `count`, else None
         """
-        self._ensure_initialized()
-        if self._collection is None:
-            return 0
-
-        # Find all embeddings with this document_id in metadata
-        results = self._collection.get(
-            where={"document_id": {"$eq": document_id}},
-            include=[]
-        )
+        collection = await self._get_collection()
+        where = {"document_id": {"$eq": document_id}}
 
-        ids_to_delete = results.get("ids", [])
-        if ids_to_delete:
-            self._collection.delete(ids=ids_to_delete)
-            logger.info(f"Deleted {len(ids_to_delete)} embeddings for document {document_id}")
+        deleted = None
+        if count:
+            existing = await self._collection_call(collection, "get", where=where, include=[])
+            deleted = len(existing["ids"])
+        await self._collection_call(collection, "delete", where=where)
+        logger.info(f"Deleted embeddings for document {document_id}")
 
-        return len(ids_to_delete)
+        return deleted
 
     async def initialize(self) -> None:
-        self._ensure_initialized()
+        await self._ensure_initialized()
 
     async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        if self._pending is not None:
+            while not self._pending.empty():
+                _, future = self._pending.get_nowait()
+                if not future.done():
+                    future.set_exception(VectorStoreError("SearchService closed"))
+            self._pending = None
+        # The OpenAI pool is shared by every instance in the process, so it
+        # outlives this one; close_openai_client() releases it on shutdown
+        self._embedding_slots = None
+        self._count = None
         self._initialized = False
         self._chroma = None
         self._collection = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+def _length_sorted_batches(
+    texts: list[str],
+    indices: list[int],
+    batch_size: int,
+) -> Iterator[list[int]]:
+    """
+    Group indices of texts into batches of similar length.
+
+    One long text in a batch of short ones holds up the whole request, so
+    indices are ordered by text length before being cut into batches of at
+    most batch_size texts and about MAX_EMBEDDING_BATCH_TOKENS tokens.
+    """
+    batch: list[int] = []
+    tokens = 0
+    for i in sorted(indices, key=lambda i: len(texts[i])):
+        estimate = len(texts[i]) // 4 + 1
+        if batch and (len(batch) == batch_size or tokens + estimate > MAX_EMBEDDING_BATCH_TOKENS):
+            yield batch
+            batch, tokens = [], 0
+        batch.append(i)
+        tokens += estimate
+    if batch:
+        yield batch
+
+
+def _decode_embeddings(data: Sequence[Any]) -> np.ndarray:
+    """
+    Decode base64 embeddings from the OpenAI API into one (n, dim) float32 array.
+
+    Left to itself the SDK decodes base64 and then calls .tolist(), boxing
+    every component as a Python float only for us to convert back.
+    """
+    raw = bytearray().join(base64.b64decode(d.embedding) for d in data)
+    return np.frombuffer(raw, dtype="<f4").reshape(len(data), -1)
+
+
+def _encode_cached_embedding(embedding: Embedding) -> bytes:
+    """Pack an embedding for the Redis cache (EMBEDDING_CACHE_DTYPE)."""
+    return embedding.astype(EMBEDDING_CACHE_DTYPE).tobytes()
+
+
+def _decode_cached_embedding(value: bytes) -> Embedding:
+    """Unpack a cached embedding to float32, back at unit length."""
+    return _normalize(np.frombuffer(value, dtype=EMBEDDING_CACHE_DTYPE).astype(np.float32))
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Scale vectors (1-D, or rows of a 2-D array) to unit length in place."""
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    embeddings /= np.where(norms == 0, 1, norms)
+    return embeddings
+
+
+@lru_cache(maxsize=1)
+def _embedding_encoding() -> tiktoken.Encoding | None:
+    try:
+        return tiktoken.encoding_for_model(settings.openai_embedding_model)
+    except Exception as e:  # Unknown model, or the BPE file couldn't be fetched
+        logger.warning(f"No tokenizer for {settings.openai_embedding_model}, truncating by characters: {e}")
+        return None
+
+
+def _truncate_for_embedding(text: str) -> str:
+    """Cut text to the embedding model's token limit."""
+    # Every token covers at least one UTF-8 byte, so this skips tokenizing
+    # all but the longest sections
+    if len(text.encode("utf-8")) <= MAX_EMBEDDING_TOKENS:
+        return text
+    encoding = _embedding_encoding()
+    if encoding is None:
+        return text[:MAX_EMBEDDING_CHARS]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= MAX_EMBEDDING_TOKENS:
+        return text
+    return encoding.decode(tokens[:MAX_EMBEDDING_TOKENS])
+
+
+_embedding_lru: OrderedDict[str, Embedding] = OrderedDict()
+
+
+def _lru_get(key: str) -> Embedding | None:
+    embedding = _embedding_lru.get(key)
+    if embedding is not None:
+        _embedding_lru.move_to_end(key)
+    return embedding
+
+
+def _lru_put(key: str, embedding: Embedding) -> None:
+    # Copy: a row view would keep its whole batch array alive
+    embedding = np.array(embedding, dtype=np.float32)
+    embedding.flags.writeable = False
+    _embedding_lru[key] = embedding
+    _embedding_lru.move_to_end(key)
+    while len(_embedding_lru) > EMBEDDING_LRU_SIZE:
+        _embedding_lru.popitem(last=False)
+
+
+def _create_openai_client() -> AsyncOpenAI:
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=OPENAI_TIMEOUT,
+        ),
+    )
+
+
+_openai_client: AsyncOpenAI | None = None
+
+
+def _shared_openai_client() -> AsyncOpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use.
+
+    Creation never awaits, so concurrent first callers can't race to build
+    two clients.
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = _create_openai_client()
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    global _openai_client
+    if _openai_client is not None:
+        client, _openai_client = _openai_client, None
+        await client.close()
+
 
 search_service = SearchService()
\ No newline at end of file
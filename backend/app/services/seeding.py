@@ -13,7 +13,7 @@ documentation content and resetting state. Used for:
 Seeding Process:
 ----------------
 1. Find all .md files in the specified directory
-2. For each file:
+2. For each file (up to SEED_CONCURRENCY at a time, each in its own session):
    a. Check if document already exists (by file_path)
    b. If exists, compare checksum - update only if changed
    c. If new, create document with sections and embeddings
@@ -33,15 +33,16 @@ The admin endpoint requires a secret to prevent accidental calls.
 Production Considerations:
 --------------------------
 - Add progress reporting for large documentation sets
-- Consider parallel processing for faster seeding
 - Add dry-run mode to preview changes
 - Implement incremental sync (only changed files)
 """
 
+import asyncio
 import logging
+from collections import Counter
 from pathlib import Path
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 
 from app.db.session import AsyncSessionLocal
 from app.models.document_base import Document
@@ -52,13 +53,17 @@ from app.models.history import EditHistory
 from app.models.query import Query
 from app.models.suggestion import EditSuggestion
 from app.services.document_service import DocumentService
-from app.services.search_service import SearchService
+from app.services.search_service import SearchService, search_service
 from app.utils.files import find_markdown_files
 
 logger = logging.getLogger(__name__)
 
+# Files seeded at once. Seeding is dominated by OpenAI embedding round trips;
+# the shared SearchService additionally caps in-flight embedding requests
+SEED_CONCURRENCY = 8
 
-async def seed_documents(base_path: Path) -> None:
+
+async def seed_documents(base_path: Path, concurrency: int = SEED_CONCURRENCY) -> None:
     """
     Seed the database with markdown documentation files.
 
@@ -75,6 +80,7 @@ async def seed_documents(base_path: Path) -> None:
     Args:
         base_path: Root directory containing markdown files.
                    File paths are stored relative to this directory.
+        concurrency: Maximum number of files processed at once.
 
     Side Effects:
         - Creates/updates Document records in PostgreSQL
@@ -91,52 +97,97 @@ async def seed_documents(base_path: Path) -> None:
         - A 500-token section costs ~$0.00001 to embed
         - 1000 sections ≈ $0.01 in API costs
     """
-    md_files = find_markdown_files(base_path)
-
-    created = updated = skipped = errors = 0
+    # Files are independent, so `concurrency` workers process them at once.
+    # Each file gets its own session (an AsyncSession can't be shared between
+    # tasks), but all share one SearchService and so one limit on embedding
+    # requests. The directory walk runs in a thread and feeds the workers as
+    # it goes, so the first file is being embedded before the walk finishes
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Path | None] = asyncio.Queue()
+    search = SearchService()
+    outcomes: Counter[str] = Counter()
 
-    async with AsyncSessionLocal() as db:
-        service = DocumentService(db)
-
-        for file_path in md_files:
-            try:
-                content = file_path.read_text(encoding="utf-8").strip()
-                if not content:
-                    skipped += 1
-                    continue
-
-                relative_path = str(file_path.relative_to(base_path))
-                existing = await service.get_document_by_path(relative_path)
-
-                if existing:
-                    checksum = service.calculate_checksum(content)
-                    if checksum != existing.checksum:
-                        await service.update_document(relative_path, content)
-                        updated += 1
-                else:
-                    await service.create_document(
-                        file_path=relative_path,
-                        content=content,
-                        generate_embeddings=True,
-                    )
-                    created += 1
+    def walk() -> None:
+        for file_path in find_markdown_files(base_path):
+            loop.call_soon_threadsafe(queue.put_nowait, file_path)
 
-                await db.commit()
+    async def worker() -> None:
+        while (file_path := await queue.get()) is not None:
+            outcomes[await _seed_file(base_path, file_path, search)] += 1
 
-            except Exception:
-                errors += 1
-                await db.rollback()
-                logger.exception("Failed to process %s", file_path)
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.to_thread(walk)
+    finally:
+        # Let the workers finish what was found (even if the walk failed)
+        for _ in workers:
+            queue.put_nowait(None)
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            await search.close()
 
     logger.info(
         "Seeding complete | created=%d updated=%d skipped=%d errors=%d",
-        created,
-        updated,
-        skipped,
-        errors,
+        outcomes["created"],
+        outcomes["updated"],
+        outcomes["skipped"],
+        outcomes["errors"],
     )
 
 
+async def _seed_file(base_path: Path, file_path: Path, search: SearchService) -> str:
+    """Create or update one file's document; returns the stats bucket it falls in."""
+    async with AsyncSessionLocal() as db:
+        service = DocumentService(db, search_service=search)
+        try:
+            # Read in a worker thread so other files' tasks keep running
+            raw = (await asyncio.to_thread(file_path.read_bytes)).strip()
+            if not raw:
+                return "skipped"
+
+            relative_path = str(file_path.relative_to(base_path))
+            # Only the stored checksum is needed to spot an unchanged file,
+            # not the document and all its sections
+            existing_checksum = await db.scalar(
+                select(Document.checksum).where(Document.file_path == relative_path)
+            )
+
+            # A match on the raw bytes means the stored content is exactly
+            # this file's text, so most files are never decoded. A mismatch
+            # may only be newline style, so compare the decoded text too
+            if existing_checksum == service.calculate_checksum(raw):
+                return "unchanged"
+            content = _decode_markdown(raw)
+            if not content:
+                return "skipped"
+
+            if existing_checksum is not None:
+                if service.calculate_checksum(content) == existing_checksum:
+                    return "unchanged"
+                await service.update_document(relative_path, content)
+                await db.commit()
+                return "updated"
+
+            await service.create_document(
+                file_path=relative_path,
+                content=content,
+                generate_embeddings=True,
+            )
+            await db.commit()
+            return "created"
+
+        except Exception:
+            await db.rollback()
+            logger.exception("Failed to process %s", file_path)
+            return "errors"
+
+
+def _decode_markdown(raw: bytes) -> str:
+    """Decode file bytes the way Path.read_text() would (universal newlines), stripped."""
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
 async def clear_database() -> None:
     """
     Delete all data from PostgreSQL tables.
@@ -149,13 +200,9 @@ async def clear_database() -> None:
     - Document sections
     - Documents
 
-    Deletion order matters due to foreign key constraints:
-    1. EditHistory (references suggestions, sections, documents)
-    2. EditSuggestion (references queries, sections)
-    3. Query (standalone)
-    4. SectionDependency (references sections)
-    5. DocumentSection (references documents)
-    6. Document (base table)
+    All six tables are emptied by one TRUNCATE, which skips per-row
+    deletes (and their WAL writes) and handles the foreign keys between
+    them, so no deletion order is needed.
 
     Use Case:
         Called before re-seeding to ensure clean state.
@@ -165,13 +212,12 @@ async def clear_database() -> None:
         This does NOT clear ChromaDB vectors - call clear_vectors()
         separately if you need to reset embeddings too.
     """
+    tables = ", ".join(
+        model.__tablename__
+        for model in (EditHistory, EditSuggestion, Query, SectionDependency, DocumentSection, Document)
+    )
     async with AsyncSessionLocal() as db:
-        await db.execute(EditHistory.__table__.delete())
-        await db.execute(EditSuggestion.__table__.delete())
-        await db.execute(Query.__table__.delete())
-        await db.execute(SectionDependency.__table__.delete())
-        await db.execute(DocumentSection.__table__.delete())
-        await db.execute(Document.__table__.delete())
+        await db.execute(text(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE"))
         await db.commit()
 
 
@@ -180,7 +226,7 @@ async def clear_vectors() -> None:
     Delete all vector embeddings from ChromaDB.
 
     DESTRUCTIVE OPERATION - Removes all document embeddings.
-    The collection itself is preserved but emptied.
+    The collection is dropped and recreated empty.
 
     This is separate from clear_database() because:
     1. Different storage backends (PostgreSQL vs ChromaDB)
@@ -191,9 +237,8 @@ async def clear_vectors() -> None:
         Failures are logged as warnings but don't raise.
         This allows seeding to continue even if ChromaDB is unavailable.
     """
-    search = SearchService()
     try:
-        search.clear_collection()
+        await search_service.clear_collection()
     except Exception:
         logger.warning("Failed to clear vector store", exc_info=True)
 
@@ -218,10 +263,13 @@ async def show_stats() -> None:
         sections were empty or embedding generation failed.
     """
     async with AsyncSessionLocal() as db:
-        documents = await db.scalar(select(func.count(Document.id)))
-        sections = await db.scalar(select(func.count(DocumentSection.id)))
+        # Both counts in one round trip, as scalar subqueries of a single row
+        documents, sections = (await db.execute(select(
+            select(func.count(Document.id)).scalar_subquery(),
+            select(func.count(DocumentSection.id)).scalar_subquery(),
+        ))).one()
 
-    vectors = SearchService().get_collection_stats().get("count", 0)
+    vectors = (await search_service.get_collection_stats()).get("count", 0)
 
     logger.info(
         "Documents: %d | Sections: %d | Vectors: %d",
@@ -1,20 +1,33 @@
-from app.tasks.query_tasks import (
-    process_query_async,
-    cleanup_old_queries,
-)
-from app.tasks.document_tasks import (
-    generate_embeddings_task,
-    reindex_document_task,
-    bulk_embed_documents_task,
-    delete_document_embeddings_task,
-)
-from app.tasks.sync_tasks import (
-    rebuild_all_dependencies_task,
-    sync_chromadb_task,
-    verify_chromadb_integrity_task,
-    cleanup_orphaned_embeddings_task,
-    health_check_task,
-)
+from importlib import import_module
+from typing import Any
+
+# Task name -> defining module. Tasks are imported on first access (PEP 562)
+# so importing one task module (e.g. app.tasks.query_tasks from an API route)
+# doesn't also load the others and everything they depend on
+_TASK_MODULES = {
+    "process_query_async": "app.tasks.query_tasks",
+    "cleanup_old_queries": "app.tasks.query_tasks",
+    "generate_embeddings_task": "app.tasks.document_tasks",
+    "reindex_document_task": "app.tasks.document_tasks",
+    "bulk_embed_documents_task": "app.tasks.document_tasks",
+    "delete_document_embeddings_task": "app.tasks.document_tasks",
+    "rebuild_all_dependencies_task": "app.tasks.sync_tasks",
+    "sync_chromadb_task": "app.tasks.sync_tasks",
+    "verify_chromadb_integrity_task": "app.tasks.sync_tasks",
+    "cleanup_orphaned_embeddings_task": "app.tasks.sync_tasks",
+    "health_check_task": "app.tasks.sync_tasks",
+    "maintain_history_partitions_task": "app.tasks.sync_tasks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _TASK_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    task = getattr(import_module(module), name)
+    globals()[name] = task  # Later lookups skip __getattr__
+    return task
+
 
 __all__ = [
     "process_query_async",
@@ -28,4 +41,5 @@ __all__ = [
     "verify_chromadb_integrity_task",
     "cleanup_orphaned_embeddings_task",
     "health_check_task",
-]
\ No newline at end of file
+    "maintain_history_partitions_task",
+]
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from uuid import UUID
 
 from celery import Task
+from chromadb.errors import InvalidArgumentError
+from openai import BadRequestError
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.celery_app import celery_app
+from app.models.document import DocumentSection
 from app.models.document_base import Document
 from app.services.document_service import DocumentService
 from app.services.search_service import SearchService
@@ -23,6 +27,19 @@ from app.utils.celery_helpers import run_async, DBSessionContext, update_task_pr
 
 logger = logging.getLogger(__name__)
 
+# Sections embedded per add_sections_batch call (one OpenAI request and one
+# Chroma upsert); progress is reported after each chunk
+EMBEDDING_CHUNK_SIZE = 100
+
+# Documents bulk_embed_documents_task embeds at once
+BULK_EMBED_CONCURRENCY = 8
+
+# Failures a single section can cause: the input rejected by OpenAI, or its
+# data by Chroma (client-side validation raises ValueError/TypeError). Only
+# these split a failed chunk to isolate the section; anything else (an
+# outage, auth, rate limits) fails the whole chunk after one call
+_SECTION_ERRORS = (BadRequestError, InvalidArgumentError, ValueError, TypeError)
+
 
 @celery_app.task(
     bind=True,
@@ -36,69 +53,103 @@ def generate_embeddings_task(
     logger.info(f"Generating embeddings for document {document_id}")
 
     async def _generate() -> GenerateEmbeddingsResultDict:
-        async with DBSessionContext() as db:
-            result = await db.execute(
-                select(Document)
-                .options(selectinload(Document.sections))
-                .where(Document.id == UUID(document_id))
-            )
-            doc = result.scalar_one_or_none()
-
-            if not doc:
-                raise ValueError(f"Document {document_id} not found")
+        search_service = SearchService()
+        await search_service.initialize()
+        try:
+            return await _generate_embeddings(document_id, search_service, task=self)
+        finally:
+            await search_service.close()
 
-            search_service = SearchService()
-            await search_service.initialize()
+    return run_async(_generate())
 
-            total_sections = len(doc.sections)
-            embeddings_created = 0
-            errors: list[EmbeddingErrorDict] = []
 
-            for i, section in enumerate(doc.sections):
-                if not section.content.strip():
-                    continue
+async def _generate_embeddings(
+    document_id: str,
+    search_service: SearchService,
+    task: Task | None = None,
+) -> GenerateEmbeddingsResultDict:
+    """Embed one document's sections; reports progress on `task` if given."""
+    async with DBSessionContext() as db:
+        result = await db.execute(
+            select(Document)
+            .options(selectinload(Document.sections))
+            .where(Document.id == UUID(document_id))
+        )
+        doc = result.scalar_one_or_none()
+
+        if not doc:
+            raise ValueError(f"Document {document_id} not found")
+
+        total_sections = len(doc.sections)
+        embeddings_created = 0
+        errors: list[EmbeddingErrorDict] = []
+
+        # Embed in chunks (one API round trip each) instead of one
+        # section at a time. Chunks are cut from the sections ordered by
+        # length, so no request waits on one long section among short
+        # ones; ids are written back per section, so order is irrelevant
+        to_embed = sorted(
+            (section for section in doc.sections if section.content.strip()),
+            key=lambda section: len(section.content),
+        )
 
-                try:
-                    embedding_id = await search_service.add_section(
-                        section_id=str(section.id),
-                        content=section.content,
-                        metadata={
+        async def embed(sections: list[DocumentSection]) -> None:
+            nonlocal embeddings_created
+            try:
+                embedding_ids = await search_service.add_sections_batch([
+                    (
+                        str(section.id),
+                        section.content,
+                        {
                             "document_id": str(doc.id),
                             "file_path": doc.file_path,
                             "section_title": section.section_title,
                             "order": section.order,
                         },
                     )
-                    section.embedding_id = embedding_id
-                    embeddings_created += 1
+                    for section in sections
+                ])
+            except Exception as e:
+                if len(sections) > 1 and isinstance(e, _SECTION_ERRORS):
+                    # One rejected section shouldn't fail its whole chunk:
+                    # retry each half until the bad ones are isolated
+                    middle = len(sections) // 2
+                    await embed(sections[:middle])
+                    await embed(sections[middle:])
+                    return
+                logger.error(
+                    f"Failed to generate embeddings for {len(sections)} sections "
+                    f"of document {document_id}: {e}"
+                )
+                errors.extend(
+                    EmbeddingErrorDict(section_id=str(section.id), error=str(e))
+                    for section in sections
+                )
+                return
+            for section, embedding_id in zip(sections, embedding_ids):
+                section.embedding_id = embedding_id
+            embeddings_created += len(embedding_ids)
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to generate embedding for section {section.id}: {e}"
-                    )
-                    errors.append(EmbeddingErrorDict(
-                        section_id=str(section.id),
-                        error=str(e),
-                    ))
+        for start in range(0, len(to_embed), EMBEDDING_CHUNK_SIZE):
+            chunk = to_embed[start : start + EMBEDDING_CHUNK_SIZE]
+            await embed(chunk)
 
+            if task is not None:
                 update_task_progress(
-                    self,
-                    i + 1,
-                    total_sections,
+                    task,
+                    start + len(chunk),
+                    len(to_embed),
                     f"Generated {embeddings_created}/{total_sections} embeddings",
                 )
 
-            await db.commit()
-            await search_service.close()
-
-            return GenerateEmbeddingsResultDict(
-                document_id=document_id,
-                total_sections=total_sections,
-                embeddings_created=embeddings_created,
-                errors=errors,
-            )
+        await db.commit()
 
-    return run_async(_generate())
+        return GenerateEmbeddingsResultDict(
+            document_id=document_id,
+            total_sections=total_sections,
+            embeddings_created=embeddings_created,
+            errors=errors,
+        )
 
 
 @celery_app.task(name="app.tasks.document_tasks.reindex_document")
@@ -144,30 +195,45 @@ def bulk_embed_documents_task(
     logger.info(f"Bulk embedding {len(document_ids)} documents")
 
     async def _bulk_embed() -> BulkEmbedResultDict:
-        results: list[BulkEmbedItemResultDict] = []
+        # Documents are embedded concurrently in this task, each with its own
+        # session but one shared SearchService (and so one limit on in-flight
+        # OpenAI requests). Calling generate_embeddings_task here would run
+        # it synchronously on this already-running event loop
+        search_service = SearchService()
+        await search_service.initialize()
+        semaphore = asyncio.Semaphore(BULK_EMBED_CONCURRENCY)
+        processed = 0
 
-        for i, doc_id in enumerate(document_ids):
-            try:
-                result = generate_embeddings_task(doc_id)
-                results.append(BulkEmbedItemResultDict(
-                    document_id=doc_id,
-                    success=True,
-                    result=result,
-                ))
-            except Exception as e:
-                logger.error(f"Failed to embed document {doc_id}: {e}")
-                results.append(BulkEmbedItemResultDict(
-                    document_id=doc_id,
-                    success=False,
-                    error=str(e),
-                ))
+        async def embed(doc_id: str) -> BulkEmbedItemResultDict:
+            nonlocal processed
+            async with semaphore:
+                try:
+                    item = BulkEmbedItemResultDict(
+                        document_id=doc_id,
+                        success=True,
+                        result=await _generate_embeddings(doc_id, search_service),
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to embed document {doc_id}: {e}")
+                    item = BulkEmbedItemResultDict(
+                        document_id=doc_id,
+                        success=False,
+                        error=str(e),
+                    )
 
+            processed += 1
             update_task_progress(
                 self,
-                i + 1,
+                processed,
                 len(document_ids),
-                f"Processed {i + 1}/{len(document_ids)} documents",
+                f"Processed {processed}/{len(document_ids)} documents",
             )
+            return item
+
+        try:
+            results = await asyncio.gather(*(embed(doc_id) for doc_id in document_ids))
+        finally:
+            await search_service.close()
 
         successful = sum(1 for r in results if r["success"])
 
@@ -189,7 +255,7 @@ def delete_document_embeddings_task(document_id: str) -> DeleteEmbeddingsResultD
         search_service = SearchService()
         await search_service.initialize()
 
-        deleted_count = await search_service.delete_by_document(document_id)
+        deleted_count = await search_service.delete_by_document(document_id, count=True)
 
         await search_service.close()
 
@@ -113,6 +113,7 @@ def process_query_async(
 
     async def _process() -> QueryProcessResultDict:
         publisher = RedisEventPublisher(query_id)
+        publisher.open_sync()
         emitter = EventEmitter(publisher, query_id)
 
         try:
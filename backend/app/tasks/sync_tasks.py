@@ -10,6 +10,7 @@ from app.celery_app import celery_app
 from app.models.document_base import Document
 from app.models.document import DocumentSection
 from app.services.dependency_service import DependencyService
+from app.services.history_service import HistoryService
 from app.services.search_service import SearchService
 from app.schemas.tasks import (
     RebuildDependenciesResultDict,
@@ -19,6 +20,7 @@ from app.schemas.tasks import (
     CleanupOrphanedResultDict,
     HealthCheckResultDict,
     ServiceHealthDict,
+    HistoryPartitionsResultDict,
 )
 from app.utils.celery_helpers import run_async, DBSessionContext, update_task_progress
 
@@ -61,7 +63,7 @@ def sync_chromadb_task(self: Task) -> SyncChromaDBResultDict:
 
             search_service = SearchService()
             await search_service.initialize()
-            search_service.clear_collection()
+            await search_service.clear_collection()
 
             total_docs = len(documents)
             total_sections = 0
@@ -69,46 +71,43 @@ def sync_chromadb_task(self: Task) -> SyncChromaDBResultDict:
             errors: list[SyncErrorDict] = []
 
             for i, doc in enumerate(documents):
+                total_sections += len(doc.sections)
+                # One add_sections_batch call per document (one embedding
+                # request and upsert per 100 sections) rather than a
+                # coalesced add_section call per section
+                sections = [section for section in doc.sections if section.content.strip()]
                 try:
-                    for section in doc.sections:
-                        total_sections += 1
-
-                        if not section.content.strip():
-                            continue
-
-                        try:
-                            await search_service.add_section(
-                                section_id=str(section.id),
-                                content=section.content,
-                                metadata={
-                                    "document_id": str(doc.id),
-                                    "file_path": doc.file_path,
-                                    "section_title": section.section_title,
-                                    "order": section.order,
-                                },
-                            )
-                            sections_synced += 1
-                        except Exception as e:
-                            logger.error(f"Failed to sync section {section.id}: {e}")
-                            errors.append(SyncErrorDict(
-                                document_id=str(doc.id),
-                                section_id=str(section.id),
-                                error=str(e),
-                            ))
-
-                    update_task_progress(
-                        self,
-                        i + 1,
-                        total_docs,
-                        f"Synced {i + 1}/{total_docs} documents ({sections_synced} sections)",
-                    )
-
+                    synced = await search_service.add_sections_batch([
+                        (
+                            str(section.id),
+                            section.content,
+                            {
+                                "document_id": str(doc.id),
+                                "file_path": doc.file_path,
+                                "section_title": section.section_title,
+                                "order": section.order,
+                            },
+                        )
+                        for section in sections
+                    ])
+                    sections_synced += len(synced)
                 except Exception as e:
                     logger.error(f"Failed to sync document {doc.id}: {e}")
-                    errors.append(SyncErrorDict(
-                        document_id=str(doc.id),
-                        error=str(e),
-                    ))
+                    errors.extend(
+                        SyncErrorDict(
+                            document_id=str(doc.id),
+                            section_id=str(section.id),
+                            error=str(e),
+                        )
+                        for section in sections
+                    )
+
+                update_task_progress(
+                    self,
+                    i + 1,
+                    total_docs,
+                    f"Synced {i + 1}/{total_docs} documents ({sections_synced} sections)",
+                )
 
             await search_service.close()
 
@@ -135,7 +134,7 @@ def verify_chromadb_integrity_task() -> VerifyIntegrityResultDict:
             search_service = SearchService()
             await search_service.initialize()
 
-            stats = search_service.get_collection_stats()
+            stats = await search_service.get_collection_stats()
 
             missing_embeddings = [
                 str(section.id)
@@ -169,7 +168,7 @@ def cleanup_orphaned_embeddings_task() -> CleanupOrphanedResultDict:
             await search_service.initialize()
 
             # Get all embedding IDs from ChromaDB
-            all_embedding_ids = search_service.list_all_ids()
+            all_embedding_ids = await search_service.list_all_ids()
             chromadb_count = len(all_embedding_ids)
 
             # Find orphaned embeddings (in ChromaDB but not in database)
@@ -181,7 +180,7 @@ def cleanup_orphaned_embeddings_task() -> CleanupOrphanedResultDict:
             # Delete orphaned embeddings
             deleted_count = 0
             if orphaned_ids:
-                deleted_count = search_service.delete_ids(orphaned_ids)
+                deleted_count = await search_service.delete_ids(orphaned_ids)
                 logger.info(f"Deleted {deleted_count} orphaned embeddings")
 
             await search_service.close()
@@ -217,7 +216,7 @@ def health_check_task() -> HealthCheckResultDict:
         try:
             search_service = SearchService()
             await search_service.initialize()
-            stats = search_service.get_collection_stats()
+            stats = await search_service.get_collection_stats()
             services["chromadb"] = stats.get("initialized", False)
             await search_service.close()
         except Exception as e:
@@ -228,4 +227,17 @@ def health_check_task() -> HealthCheckResultDict:
             services=services,
         )
 
-    return run_async(_health_check())
\ No newline at end of file
+    return run_async(_health_check())
+
+
+@celery_app.task(name="app.tasks.sync_tasks.maintain_history_partitions")
+def maintain_history_partitions_task() -> HistoryPartitionsResultDict:
+    logger.info("Maintaining edit history partitions")
+
+    async def _maintain() -> HistoryPartitionsResultDict:
+        async with DBSessionContext() as db:
+            dropped = await HistoryService(db).maintain_partitions()
+
+            return HistoryPartitionsResultDict(dropped_partitions=dropped)
+
+    return run_async(_maintain())
@@ -1,8 +1,12 @@
+from collections.abc import Iterator
 from pathlib import Path
 
 
-def find_markdown_files(base_path: Path) -> list[Path]:
-    files = list(base_path.glob("**/*.md"))
-    if not files:
+def find_markdown_files(base_path: Path) -> Iterator[Path]:
+    """Yield the .md files under base_path as the directory walk finds them."""
+    found = False
+    for path in base_path.glob("**/*.md"):
+        found = True
+        yield path
+    if not found:
         raise FileNotFoundError(f"No markdown files found in {base_path}")
-    return files
@@ -13,7 +13,7 @@ from app.services.search_service import search_service
 async def sync_sections_to_chromadb():
     await search_service.initialize()
 
-    stats = search_service.get_collection_stats()
+    stats = await search_service.get_collection_stats()
     print(f"ChromaDB before: {stats['count']} sections")
     
     async with async_session_maker() as db:
@@ -28,22 +28,22 @@ async def sync_sections_to_chromadb():
         for section in sections:
             if not section.content.strip():
                 continue 
-            batch.append({
-                "section_id": section.id,
-                "content": section.content,
-                "metadata": {
+            batch.append((
+                section.id,
+                section.content,
+                {
                     "document_id": str(section.document_id),
                     "file_path": section.document.file_path,
                     "section_title": section.section_title or "",
                     "order": section.order
                 },
-            })
+            ))
         
         if batch:
-            count = await search_service.add_sections_batch(batch)
-            print(f"Synced {count} sections to ChromaDB")
+            synced = await search_service.add_sections_batch(batch)
+            print(f"Synced {len(synced)} sections to ChromaDB")
     
-    stats = search_service.get_collection_stats()
+    stats = await search_service.get_collection_stats()
     print(f"ChromaDB after: {stats['count']} sections")
 
 
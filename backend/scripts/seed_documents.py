@@ -19,7 +19,7 @@ from app.models.history import EditHistory
 from app.models.query import Query
 from app.models.suggestion import EditSuggestion
 from app.services.document_service import DocumentService
-from app.services.search_service import SearchService
+from app.services.search_service import SearchService, search_service
 
 logger = logging.getLogger(__name__)
 
@@ -100,16 +100,16 @@ async def clear_database() -> None:
 
 async def clear_vectors(search: SearchService) -> None:
     try:
-        count = search.get_collection_stats().get("count", 0)
+        count = (await search.get_collection_stats()).get("count", 0)
         logger.info("Clearing %d vectors", count)
-        search.clear_collection()
+        await search.clear_collection()
     except Exception:
         logger.warning("Failed to clear vector store", exc_info=True)
 
 
 async def clear_and_reseed(base_path: Path) -> None:
     await create_schema()
-    await clear_vectors(SearchService())
+    await clear_vectors(search_service)
     await clear_database()
     await seed_documents(base_path)
 
@@ -117,10 +117,13 @@ async def clear_and_reseed(base_path: Path) -> None:
 
 async def show_stats() -> None:
     async with AsyncSessionLocal() as db:
-        docs = await db.scalar(select(func.count(Document.id)))
-        sections = await db.scalar(select(func.count(DocumentSection.id)))
+        # Both counts in one round trip, as scalar subqueries of a single row
+        docs, sections = (await db.execute(select(
+            select(func.count(Document.id)).scalar_subquery(),
+            select(func.count(DocumentSection.id)).scalar_subquery(),
+        ))).one()
 
-    vectors = SearchService().get_collection_stats().get("count", 0)
+    vectors = (await search_service.get_collection_stats()).get("count", 0)
 
     logger.info(
         "\nDocuments: %d\nSections: %d\nVectors: %d",
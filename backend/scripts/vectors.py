@@ -3,7 +3,7 @@ from app.services.search_service import search_service
 
 async def check_vectors():
     await search_service.initialize()
-    stats = search_service.get_collection_stats()
+    stats = await search_service.get_collection_stats()
     print(f"Collection name: {stats['name']}")
     print(f"Vector count: {stats['count']}")
     print(f"Initialized: {stats['initialized']}")
@@ -0,0 +1,74 @@
+"""Round-trips through CompressedText, including pre-compression values."""
+import uuid
+
+import pytest
+from sqlalchemy import LargeBinary, select, type_coerce, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import ZSTD_MAGIC, Base, compress_text, decompress_text
+from app.models.history import EditHistory, UserAction
+
+SAMPLES = ["", "plain ascii", "## Überschrift\n\nñ — 日本語 ✓\n" * 50]
+
+
+class TestCompressText:
+
+    @pytest.mark.parametrize("value", SAMPLES)
+    def test_round_trip(self, value):
+        compressed = compress_text(value)
+
+        assert compressed.startswith(ZSTD_MAGIC)
+        assert decompress_text(compressed) == value
+
+    @pytest.mark.parametrize("value", SAMPLES)
+    def test_legacy_text_value(self, value):
+        assert decompress_text(value) == value
+
+    @pytest.mark.parametrize("value", SAMPLES)
+    def test_legacy_utf8_bytes(self, value):
+        # A TEXT value after ALTER ... TYPE bytea USING convert_to(..., 'UTF8')
+        assert decompress_text(value.encode("utf-8")) == value
+
+
+class TestCompressedTextColumn:
+
+    @pytest.fixture
+    async def db(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+        await engine.dispose()
+
+    async def test_orm_round_trip_and_legacy_rows(self, db):
+        content = SAMPLES[-1]
+        entry = EditHistory(
+            document_id=uuid.uuid4(),
+            old_content=content,
+            new_content="new",
+            user_action=UserAction.EDITED,
+        )
+        db.add(entry)
+        await db.commit()
+        entry_id = entry.id
+
+        table = EditHistory.__table__
+        stored = await db.scalar(select(type_coerce(table.c.old_content, LargeBinary)))
+        assert stored.startswith(ZSTD_MAGIC)
+
+        # Bypass the type to write a legacy (uncompressed UTF-8) value
+        await db.execute(
+            update(table)
+            .where(table.c.id == entry_id)
+            .values({table.c.new_content: type_coerce(b"legacy \xc3\xbc", LargeBinary)})
+        )
+        await db.commit()
+        db.expire_all()
+
+        loaded = await db.scalar(select(EditHistory).where(EditHistory.id == entry_id))
+        assert loaded.old_content == content
+        assert loaded.new_content == "legacy \u00fc"
@@ -0,0 +1,103 @@
+"""Error handling of chunked section embedding in the document tasks."""
+import uuid
+
+import pytest
+from chromadb.errors import ChromaError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import Base
+from app.models.document import DocumentSection
+from app.models.document_base import Document
+from app.tasks import document_tasks
+
+
+class FakeSearchService:
+    """Rejects any batch containing a section whose content starts with "bad"."""
+
+    def __init__(self, outage: Exception | None = None):
+        self.calls = []
+        self.outage = outage
+
+    async def add_sections_batch(self, items):
+        self.calls.append(len(items))
+        if self.outage is not None:
+            raise self.outage
+        if any(content.startswith("bad") for _, content, _ in items):
+            raise ValueError("section rejected")
+        return [section_id for section_id, _, _ in items]
+
+
+@pytest.fixture
+async def session_maker(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(document_tasks, "DBSessionContext", maker)
+    yield maker
+    await engine.dispose()
+
+
+async def _create_document(maker, contents):
+    async with maker() as db:
+        doc = Document(file_path="a.md", title="a", content="", checksum="c")
+        db.add(doc)
+        await db.flush()
+        db.add_all([
+            DocumentSection(document_id=doc.id, section_title=f"s{i}", content=content, order=i)
+            for i, content in enumerate(contents)
+        ])
+        await db.commit()
+        return str(doc.id)
+
+
+class TestGenerateEmbeddings:
+
+    async def test_rejected_section_fails_alone(self, session_maker, monkeypatch):
+        monkeypatch.setattr(document_tasks, "EMBEDDING_CHUNK_SIZE", 8)
+        contents = [f"good {i}" for i in range(7)] + ["bad one"]
+        document_id = await _create_document(session_maker, contents)
+        search = FakeSearchService()
+
+        result = await document_tasks._generate_embeddings(document_id, search)
+
+        assert result["embeddings_created"] == 7
+        assert len(result["errors"]) == 1
+        async with session_maker() as db:
+            sections = (await db.execute(select(DocumentSection))).scalars().all()
+        failed = [s for s in sections if s.embedding_id is None]
+        assert [s.content for s in failed] == ["bad one"]
+
+    async def test_systemic_error_fails_chunk_in_one_call(self, session_maker, monkeypatch):
+        monkeypatch.setattr(document_tasks, "EMBEDDING_CHUNK_SIZE", 8)
+        document_id = await _create_document(session_maker, [f"good {i}" for i in range(8)])
+        search = FakeSearchService(outage=ChromaError("connection refused"))
+
+        result = await document_tasks._generate_embeddings(document_id, search)
+
+        assert search.calls == [8]
+        assert result["embeddings_created"] == 0
+        assert len(result["errors"]) == 8
+
+    async def test_counts_returned_ids(self, session_maker, monkeypatch):
+        monkeypatch.setattr(document_tasks, "EMBEDDING_CHUNK_SIZE", 3)
+        document_id = await _create_document(session_maker, ["x", "  ", "yy", "zzz", "w"])
+        search = FakeSearchService()
+
+        result = await document_tasks._generate_embeddings(document_id, search)
+
+        assert result == {
+            "document_id": document_id,
+            "total_sections": 5,
+            "embeddings_created": 4,
+            "errors": [],
+        }
+        assert search.calls == [3, 1]
+
+    async def test_missing_document_raises(self, session_maker):
+        with pytest.raises(ValueError):
+            await document_tasks._generate_embeddings(str(uuid.uuid4()), FakeSearchService())
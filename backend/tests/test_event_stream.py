@@ -0,0 +1,133 @@
+"""Tests for resumable Redis Stream delivery in RedisEventSubscriber."""
+import pytest
+from uuid import uuid4
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.services.event_service import (
+    EventType,
+    QueryEvent,
+    RedisEventSubscriber,
+    STREAM_OPEN_FIELD,
+    _get_stream_name,
+)
+
+
+@pytest.fixture
+async def redis():
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+def _subscriber(redis, query_id, consumer_id="client-1", **kwargs):
+    subscriber = RedisEventSubscriber(query_id, consumer_id=consumer_id, **kwargs)
+    subscriber._redis = redis
+    return subscriber
+
+
+async def _publish(redis, query_id, *messages):
+    stream = _get_stream_name(query_id)
+    await redis.xadd(stream, {STREAM_OPEN_FIELD: b"1"})
+    for message in messages:
+        event = QueryEvent(EventType.STATUS, {"message": message}, query_id)
+        await redis.xadd(stream, event.to_stream_fields())
+    end = QueryEvent(EventType.COMPLETED, {"_stream_end": True}, query_id)
+    await redis.xadd(stream, end.to_stream_fields())
+    return stream
+
+
+class TestResumableSubscriber:
+    """XREADGROUP cursor, batched XACK and resume behaviour."""
+
+    async def test_reads_all_events_and_acks_them(self, redis):
+        query_id = str(uuid4())
+        stream = await _publish(redis, query_id, "a", "b", "c")
+
+        received = [
+            event.to_event().data["message"]
+            async for event in _subscriber(redis, query_id).events()
+        ]
+
+        assert received == ["a", "b", "c"]
+        pending = await redis.xpending(stream, "sse:client-1")
+        assert pending["pending"] == 0
+
+    async def test_resume_redelivers_only_unacknowledged_events(self, redis):
+        query_id = str(uuid4())
+        await _publish(redis, query_id, "a", "b", "c")
+
+        events = _subscriber(redis, query_id).events()
+        first = [(await anext(events)).to_event().data["message"] for _ in range(2)]
+        await events.aclose()  # Disconnect while "b" is still being handled
+
+        resumed = [
+            event.to_event().data["message"]
+            async for event in _subscriber(redis, query_id).events()
+        ]
+
+        assert first == ["a", "b"]
+        assert resumed == ["b", "c"]
+
+    async def test_other_consumers_replay_from_start(self, redis):
+        query_id = str(uuid4())
+        await _publish(redis, query_id, "a", "b")
+
+        async for _ in _subscriber(redis, query_id).events():
+            pass
+        other = [
+            event.to_event().data["message"]
+            async for event in _subscriber(redis, query_id, consumer_id="client-2").events()
+        ]
+
+        assert other == ["a", "b"]
+
+    async def test_skips_pending_entries_trimmed_from_stream(self, redis):
+        query_id = str(uuid4())
+        stream = await _publish(redis, query_id, "a", "b")
+
+        events = _subscriber(redis, query_id).events()
+        await anext(events)
+        await events.aclose()
+        # "a" is pending for the consumer but no longer in the stream
+        entries = await redis.xrange(stream)
+        await redis.xdel(stream, entries[1][0])
+
+        resumed = [
+            event.to_event().data["message"]
+            async for event in _subscriber(redis, query_id).events()
+        ]
+
+        assert resumed == ["b"]
+
+    async def test_unknown_stream_is_created_with_ttl(self, redis):
+        query_id = str(uuid4())
+
+        events = [
+            event async for event in _subscriber(redis, query_id, timeout=-1).events()
+        ]
+
+        assert [event.event for event in events] == [EventType.ERROR]
+        assert await redis.ttl(_get_stream_name(query_id)) > 0
+
+    async def test_relay_acks_events_before_returning(self, redis, monkeypatch):
+        from app.api.routes.queries import _relay_redis_events
+
+        async def connect(self):
+            self._redis = redis
+            return redis
+
+        monkeypatch.setattr(RedisEventSubscriber, "_connect", connect)
+        query_id = str(uuid4())
+        stream = _get_stream_name(query_id)
+        await redis.xadd(stream, {STREAM_OPEN_FIELD: b"1"})
+        for event_type in (EventType.STATUS, EventType.COMPLETED, EventType.STATUS):
+            await redis.xadd(stream, QueryEvent(event_type, {}, query_id).to_stream_fields())
+
+        frames = [frame async for frame in _relay_redis_events(query_id, "client-1")]
+
+        assert len(frames) == 2  # Stops after COMPLETED
+        # Placeholder and first STATUS acked on exit; COMPLETED (never
+        # resumed past) and the unread tail stay pending for a resume
+        pending = await redis.xpending(stream, "sse:client-1")
+        assert pending["pending"] == 2
@@ -0,0 +1,74 @@
+"""Keyset pagination of edit history when entries share created_at."""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.api.utils.helper import list_history_entries
+from app.db.base import Base
+from app.models.history import EditHistory, UserAction
+from app.services.history_service import HistoryService
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def section_entries(db):
+    """Seven entries for one section, all written at the same instant."""
+    section_id = uuid.uuid4()
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    entries = [
+        EditHistory(
+            document_id=uuid.uuid4(),
+            section_id=section_id,
+            old_content=f"old {i}",
+            new_content=f"new {i}",
+            user_action=UserAction.ACCEPTED,
+            created_at=created_at,
+        )
+        for i in range(7)
+    ]
+    db.add_all(entries)
+    await db.commit()
+    return section_id, {entry.id for entry in entries}
+
+
+class TestKeysetPagination:
+    """Pages must neither skip nor repeat entries with equal created_at."""
+
+    async def test_section_history_pages_cover_ties(self, db, section_entries):
+        section_id, expected = section_entries
+        service = HistoryService(db)
+
+        seen, after = [], None
+        while page := await service.get_section_history(section_id, limit=3, after=after):
+            seen.extend(entry.id for entry in page)
+            after = (page[-1].created_at, page[-1].id)
+
+        assert len(seen) == len(expected)
+        assert set(seen) == expected
+
+    async def test_list_history_entries_pages_cover_ties(self, db, section_entries):
+        section_id, expected = section_entries
+
+        seen, cursor = [], None
+        while page := await list_history_entries(
+            db, limit=3, cursor=cursor, section_id=section_id
+        ):
+            seen.extend(entry.id for entry in page)
+            cursor = (page[-1].created_at, page[-1].id)
+
+        assert len(seen) == len(expected)
+        assert set(seen) == expected
@@ -0,0 +1,111 @@
+"""Unit tests for SearchService batching (no Chroma/OpenAI/Redis needed)."""
+import numpy as np
+import pytest
+from chromadb.api.types import validate_metadatas
+
+from app.services.search_service import (
+    SearchService,
+    _decode_cached_embedding,
+    _encode_cached_embedding,
+)
+
+
+class FakeCollection:
+    """Records upserts, validating metadatas the way Chroma does."""
+
+    def __init__(self):
+        self.upserts = []
+
+    async def upsert(self, ids, embeddings, documents, metadatas=None):
+        if metadatas is not None:
+            validate_metadatas(metadatas)
+        self.upserts.append((ids, metadatas))
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = SearchService()
+    service._collection = FakeCollection()
+    service._initialized = True
+
+    async def embed(texts, batch_size=100):
+        return np.ones((len(texts), 3), dtype=np.float32)
+
+    monkeypatch.setattr(service, "_get_embeddings_batch", embed)
+    return service
+
+
+class TestAddSectionsBatch:
+    """Metadata handling in add_sections_batch."""
+
+    async def test_sections_without_metadata_are_upserted_separately(self, service):
+        ids = await service.add_sections_batch([
+            ("a", "alpha", {"order": 1}),
+            ("b", "beta", None),
+            ("c", "gamma", {"skip": None}),
+        ])
+
+        assert ids == ["a", "b", "c"]
+        assert service._collection.upserts == [
+            (["a"], [{"order": 1}]),
+            (["b", "c"], None),
+        ]
+
+    async def test_all_empty_metadata_omits_metadatas(self, service):
+        await service.add_sections_batch([("a", "alpha", None), ("b", "beta", {})])
+
+        assert service._collection.upserts == [(["a", "b"], None)]
+
+
+class TestEmbeddingCacheEncoding:
+    """float16 Redis cache encoding of unit-length float32 embeddings."""
+
+    def test_round_trip_is_close_and_unit_length(self):
+        rng = np.random.default_rng(0)
+        embedding = rng.standard_normal(1536).astype(np.float32)
+        embedding /= np.linalg.norm(embedding)
+
+        encoded = _encode_cached_embedding(embedding)
+        decoded = _decode_cached_embedding(encoded)
+
+        assert len(encoded) == embedding.size * 2  # half precision
+        assert decoded.dtype == np.float32
+        assert decoded.flags.writeable
+        assert np.linalg.norm(decoded) == pytest.approx(1.0, abs=1e-6)
+        assert np.allclose(decoded, embedding, atol=1e-3)
+
+    def test_zero_vector_stays_zero(self):
+        decoded = _decode_cached_embedding(_encode_cached_embedding(np.zeros(8, np.float32)))
+
+        assert not decoded.any()
+
+
+class TestBuildWhereClause:
+
+    def test_filters_combine_with_and(self):
+        assert SearchService._build_where_clause("a.md", "doc") == {
+            "$and": [{"file_path": {"$eq": "a.md"}}, {"document_id": {"$eq": "doc"}}]
+        }
+        assert SearchService._build_where_clause(None, None) is None
+
+    def test_each_call_returns_a_fresh_dict(self):
+        first = SearchService._build_where_clause("a.md", None)
+        first["file_path"]["$eq"] = "mutated"
+
+        assert SearchService._build_where_clause("a.md", None) == {"file_path": {"$eq": "a.md"}}
+
+
+class TestIterResults:
+
+    def test_scores_filter_and_missing_metadata(self):
+        results = {
+            "ids": [["a", "b"]],
+            "documents": [["alpha", "beta"]],
+            "metadatas": [[{"order": 1}, None]],
+            "distances": [[0.1, 0.6]],
+        }
+
+        assert list(SearchService()._iter_results(results, min_score=0.5)) == [
+            {"section_id": "a", "content": "alpha", "metadata": {"order": 1}, "score": 0.9},
+        ]
+        assert list(SearchService()._iter_results(results, None))[1]["metadata"] == {}